@@ -5,7 +5,9 @@ Provides centralized configuration loading, validation, and management.
 
 import yaml
 import os
+import shutil
 from lib.debug_utils import debug_print
+from lib.yaml_cache import SafeLoader, load_yaml_cached, save_yaml
 
 
 class ConfigManager:
@@ -24,8 +26,7 @@ class ConfigManager:
         """
         if self._config is None or force_reload:
             try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    self._config = yaml.safe_load(f) or {}
+                self._config = load_yaml_cached(self.config_path)
                 if not silent:
                     debug_print(f"Configuration loaded from {self.config_path}")
             except (FileNotFoundError, yaml.YAMLError, PermissionError) as e:
@@ -38,18 +39,16 @@ class ConfigManager:
         return self._config.copy()  # Return a copy to prevent external modifications
     
     def save_config(self, config):
-        """Save configuration to file"""
+        """Save configuration to file (atomically, a crash never leaves a torn file)
+        
+        The previous version is kept as <config>.backup, as before.
+        """
         try:
-            # Backup current config
+            # Backup current config (copied, so config.yaml itself stays in place until the replace)
             if os.path.exists(self.config_path):
-                backup_path = f"{self.config_path}.backup"
-                # Remove old backup if exists
-                if os.path.exists(backup_path):
-                    os.remove(backup_path)
-                os.rename(self.config_path, backup_path)
+                shutil.copyfile(self.config_path, f"{self.config_path}.backup")
             
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.safe_dump(config, f, default_flow_style=False, indent=2)
+            save_yaml(self.config_path, config, default_flow_style=False, indent=2)
             
             # Update cached config
             self._config = config.copy()
@@ -58,13 +57,6 @@ class ConfigManager:
             
         except (PermissionError, OSError) as e:
             debug_print(f"Error saving config: {e}", 'error')
-            # Restore backup if it exists
-            backup_path = f"{self.config_path}.backup"
-            if os.path.exists(backup_path):
-                try:
-                    os.rename(backup_path, self.config_path)
-                except Exception:
-                    pass
             return False
         except Exception as e:
             debug_print(f"Unexpected error saving config: {e}", 'error')
@@ -170,7 +162,7 @@ class ConfigManager:
                 return False
             
             with open(path_to_check, 'r', encoding='utf-8') as f:
-                yaml.safe_load(f)
+                yaml.load(f, Loader=SafeLoader)
             return True
             
         except (yaml.YAMLError, PermissionError):
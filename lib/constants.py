@@ -6,11 +6,13 @@ Application constants for PhotoFrame
 DEFAULT_CONFIG_PATH = "tools/config.yaml"
 PORTRAIT_HISTORY_FILE = "tools/portrait_folders_history.txt"
 LANDSCAPE_HISTORY_FILE = "tools/landscape_folders_history.txt"
+YAML_CACHE_MAX_ENTRIES = 100  # parsed YAML files kept in memory (least recently used dropped first)
 
 # LCD Display constants
 DEFAULT_LCD_WIDTH = 320
 DEFAULT_LCD_HEIGHT = 480
 DEFAULT_COM_PORT = "COM3"
+LCD_WRITE_TIMEOUT = 5.0  # seconds a serial write may block before giving up on the frame
 
 # Display orientations
 ORIENTATION_PORTRAIT = "Portrait"
@@ -21,6 +23,8 @@ VALID_ORIENTATIONS = [ORIENTATION_PORTRAIT, ORIENTATION_LANDSCAPE]
 MIN_SLIDESHOW_INTERVAL = 1
 DEFAULT_SLIDESHOW_INTERVAL = 30
 DEFAULT_SHUFFLE_ENABLED = True
+CONFIG_WATCH_INTERVAL = 1.0  # seconds between config file mtime checks
+CONFIG_MTIME_RESOLUTION_NS = 2_000_000_000  # coarsest mtime step to allow for (FAT/exFAT: 2 s)
 
 # Image processing constants
 TEMP_IMAGE_PREFIX = "temp_display_"
@@ -51,6 +55,10 @@ DEFAULT_DEBUG_LEVEL = 'info'
 
 # Tray icon constants
 TRAY_DOUBLE_CLICK_DELAY = 0.5  # seconds
+TRAY_ICON_SIZE = (64, 64)  # pixels; larger icon assets are scaled down once at load
+TRAY_CLICK_COOLDOWN = 1.0  # seconds during which repeated tray clicks are ignored
+RELOAD_LOCK_GRACE = 1.0  # seconds the slideshow stays paused after a manual folder switch
+EDITOR_REAP_INTERVAL = 1.0  # seconds between checks for a closed config editor while one is open
 
 # Configuration sections
 CONFIG_SECTION_SLIDESHOW = 'slideshow'
@@ -4,6 +4,8 @@ Shared debug utilities for PhotoFrame application
 import yaml
 from pathlib import Path
 
+from lib.yaml_cache import SafeLoader as _SafeLoader
+
 class DebugConfig:
     DEBUG_ENABLED = True
     DEBUG_LEVEL = 'info'
@@ -22,32 +24,40 @@ class DebugConfig:
                 config_path = current_file.parent.parent / "tools" / "config.yaml"
                 
             if config_path.exists():
-                with config_path.open("r", encoding="utf-8") as f:
-                    config = yaml.safe_load(f) or {}
-                    debug_config = config.get('debug', {})
-                    cls.DEBUG_ENABLED = debug_config.get('enabled', True)
-                    cls.DEBUG_LEVEL = debug_config.get('level', 'info')
+                config = yaml.load(config_path.read_bytes(), Loader=_SafeLoader) or {}
+                debug_config = config.get('debug', {})
+                cls.DEBUG_ENABLED = debug_config.get('enabled', True)
+                cls.DEBUG_LEVEL = debug_config.get('level', 'info')
         except Exception:
             pass  # Use defaults if config loading fails
         finally:
             cls._config_loaded = True
     
     @classmethod
-    def debug_print(cls, message, level='info'):
-        """Print debug message if debug is enabled and level matches"""
+    def is_enabled(cls, level='info'):
+        """Return True if a message at this level would be printed"""
         if not cls._config_loaded:
             cls.load_config()
             
         if not cls.DEBUG_ENABLED:
-            return
+            return False
             
-        if level == 'error' or cls.DEBUG_LEVEL in ['info', 'debug']:
+        return level == 'error' or cls.DEBUG_LEVEL in ['info', 'debug']
+
+    @classmethod
+    def debug_print(cls, message, level='info'):
+        """Print debug message if debug is enabled and level matches"""
+        if cls.is_enabled(level):
             print(message)
 
-# Convenience function for direct use
+# Convenience functions for direct use
 def debug_print(message, level='info'):
     """Convenience function for debug printing"""
     DebugConfig.debug_print(message, level)
 
+def debug_enabled(level='info'):
+    """Check before building expensive (f-string) messages on hot paths"""
+    return DebugConfig.is_enabled(level)
+
 # Initialize configuration on import
 DebugConfig.load_config()
\ No newline at end of file
@@ -6,18 +6,22 @@ Clean implementation without system monitor dependencies
 import os
 import time
 import yaml
+import serial
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 from lib.lcd import lcd_comm_rev_a
 
 # Import shared utilities
-from .debug_utils import debug_print
+from .debug_utils import debug_print, debug_enabled
 from .constants import *
+from .yaml_cache import load_yaml_cached
 
 class LCDDisplay:
-    def __init__(self, serial_port="COM3", brightness=85):
+    def __init__(self, serial_port="COM3", brightness=85, write_timeout=LCD_WRITE_TIMEOUT):
         self.serial_port = serial_port
         self.brightness = brightness
+        # Enforced by the serial port itself so a stuck LCD can't hang a frame forever
+        self.write_timeout = write_timeout
         # default physical screen size for portrait device
         self.width = DEFAULT_LCD_WIDTH
         self.height = DEFAULT_LCD_HEIGHT
@@ -34,8 +38,7 @@ class LCDDisplay:
 
             if cfg_path and os.path.exists(cfg_path):
                 try:
-                    with open(cfg_path, 'r', encoding='utf-8') as f:
-                        cfg = yaml.safe_load(f) or {}
+                    cfg = load_yaml_cached(cfg_path)
                     debug_print(f"Loaded config from: {cfg_path}")
                 except (FileNotFoundError, yaml.YAMLError, PermissionError) as e:
                     debug_print(f"Failed to load config '{cfg_path}': {e}", 'error')
@@ -71,7 +74,7 @@ class LCDDisplay:
         try:
             debug_print(f"Connecting to LCD on {self.serial_port}...")
             # Create rev A comm object and run its initialization handshake
-            self.lcd = lcd_comm_rev_a.LcdCommRevA(self.serial_port)
+            self.lcd = lcd_comm_rev_a.LcdCommRevA(self.serial_port, write_timeout=self.write_timeout)
             # Use the library's initialization method
             try:
                 self.lcd.InitializeComm()
@@ -264,8 +267,9 @@ class LCDDisplay:
             with_overlay: Whether this image includes overlay (for logging)
         """
         try:
-            overlay_text = " (with overlay)" if with_overlay else ""
-            debug_print(f"display_image_with_overlay: sending {image.size} image{overlay_text}, mode={image.mode}")
+            if debug_enabled():
+                overlay_text = " (with overlay)" if with_overlay else ""
+                debug_print(f"display_image_with_overlay: sending {image.size} image{overlay_text}, mode={image.mode}")
             
             # Ensure correct size for LCD
             try:
@@ -283,10 +287,45 @@ class LCDDisplay:
             if self.lcd:
                 self.lcd.DisplayPILImage(image, 0, 0, image.size[0], image.size[1])
             return True
+        except serial.SerialTimeoutException as e:
+            # The port stalled for write_timeout; the bitmap fallback would write to the
+            # same port and block again, so drop this frame and resync before the next one
+            debug_print(f"LCD write timed out, skipping frame: {e}", 'error')
+            self._resync_lcd()
+            return False
         except Exception:
             # Fallback to bitmap display
             return self._fallback_bitmap_display(image)
     
+    def _resync_lcd(self):
+        """Bring the LCD back to a command boundary after a bitmap transfer was cut short
+        
+        Rev. A has no framing: after DISPLAY_BITMAP the controller counts pixel bytes, and a
+        timed-out write doesn't say how many went out, so the gap can't be padded. Left alone,
+        the next frame's header would be read as pixel data. Drop what is still queued in the
+        driver and run the library's reset (the same recovery it uses for a screen left in an
+        unstable state), then redo the init handshake.
+        """
+        lcd = self.lcd
+        try:
+            if lcd.lcd_serial is not None:
+                lcd.lcd_serial.reset_output_buffer()
+        except (serial.SerialException, OSError):
+            pass
+        try:
+            try:
+                # RESET, close, wait for the display to reboot, reopen
+                lcd.Reset()
+            except serial.SerialException:
+                # RESET didn't go out either - reopening the port is all that is left
+                lcd.closeSerial()
+                lcd.openSerial()
+            lcd.InitializeComm()
+            lcd.SetBrightness(self.brightness)
+            debug_print("LCD reset after write timeout")
+        except Exception as e:
+            debug_print(f"Failed to reset LCD after write timeout: {e}", 'error')
+
     def _fallback_bitmap_display(self, image):
         """Fallback display method using temporary bitmap file"""
         if not self.lcd:
@@ -438,11 +477,11 @@ class LCDDisplay:
         """
         try:
             img = image
+            # Skip building per-frame log messages when debug output is off
+            verbose = debug_enabled()
             # Log source size before any transforms (rotation/resize)
-            try:
+            if verbose:
                 debug_print(f"_prepare_image_for_display: source size before transforms {img.size}")
-            except Exception:
-                pass
             # Determine target size explicitly
             if self.frame_orientation == 'Landscape':
                 target_w, target_h = 480, 320
@@ -462,7 +501,8 @@ class LCDDisplay:
 
             if rotate_degrees:
                 try:
-                    debug_print(f"_prepare_image_for_display: rotating {rotate_degrees}deg to match frame")
+                    if verbose:
+                        debug_print(f"_prepare_image_for_display: rotating {rotate_degrees}deg to match frame")
                     img = img.rotate(rotate_degrees, expand=True)
                 except Exception as e:
                     debug_print(f"_prepare_image_for_display: rotation failed: {e}", 'error')
@@ -471,13 +511,15 @@ class LCDDisplay:
             # so that landscape-folder images appear the same as portrait ones.
             try:
                 if self.frame_orientation == 'Landscape':
-                    debug_print(f"_prepare_image_for_display: force-resizing to {target_w}x{target_h} for landscape display")
+                    if verbose:
+                        debug_print(f"_prepare_image_for_display: force-resizing to {target_w}x{target_h} for landscape display")
                     final = img.resize((target_w, target_h), Image.Resampling.LANCZOS)
                     # Apply 180deg flip if device is inverted (after composing)
                     if getattr(self, 'inverse', False):
                         debug_print("_prepare_image_for_display: applying 180deg inverse flip")
                         final = final.rotate(180)
-                    debug_print(f"_prepare_image_for_display: final size {final.size}")
+                    if verbose:
+                        debug_print(f"_prepare_image_for_display: final size {final.size}")
                     return final
 
                 # Fit image into target while preserving aspect ratio and center it (portrait/default)
@@ -485,7 +527,8 @@ class LCDDisplay:
                 scale = min(target_w / src_w, target_h / src_h)
                 new_w = max(1, int(src_w * scale))
                 new_h = max(1, int(src_h * scale))
-                debug_print(f"_prepare_image_for_display: resizing from {src_w}x{src_h} to {new_w}x{new_h} (target {target_w}x{target_h})")
+                if verbose:
+                    debug_print(f"_prepare_image_for_display: resizing from {src_w}x{src_h} to {new_w}x{new_h} (target {target_w}x{target_h})")
                 img_resized = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
 
                 # Create final canvas and paste centered
@@ -499,7 +542,8 @@ class LCDDisplay:
                     debug_print("_prepare_image_for_display: applying 180deg inverse flip")
                     final = final.rotate(180)
 
-                debug_print(f"_prepare_image_for_display: final size {final.size}, pasted at ({offset_x},{offset_y})")
+                if verbose:
+                    debug_print(f"_prepare_image_for_display: final size {final.size}, pasted at ({offset_x},{offset_y})")
                 return final
             except Exception as e:
                 debug_print(f"_prepare_image_for_display: error during resize/compose: {e}", 'error')
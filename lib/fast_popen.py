@@ -0,0 +1,51 @@
+"""
+Minimal process launcher for the configuration editor: spawn, poll and signal by pid
+Uses os.posix_spawn where available, otherwise subprocess.Popen(close_fds=False)
+"""
+
+import os
+
+
+class FastPopen:
+    """Spawn argv and track it by pid - the subset of Popen the tray needs"""
+
+    def __init__(self, args, cwd=None):
+        self.args = list(args)
+        self.returncode = None
+        self._proc = None
+
+        # posix_spawn cannot change directory, so only use it when no chdir is needed
+        if cwd is not None and os.path.abspath(cwd) == os.getcwd():
+            cwd = None
+        if hasattr(os, 'posix_spawn') and cwd is None:
+            # Child inherits stdio; no pipes, no fd-table walk. args[0] must be a path (no PATH search)
+            self.pid = os.posix_spawn(self.args[0], self.args, os.environ)
+        else:
+            # Windows, or a chdir is needed: Popen, still skipping the close_fds walk.
+            # Never a bare os.fork() - the caller has several threads, and a forked copy of
+            # their locks can deadlock the child before it execs
+            import subprocess
+            self._proc = subprocess.Popen(self.args, cwd=cwd, close_fds=False)
+            self.pid = self._proc.pid
+
+    def poll(self):
+        """Return exit code if the process has finished, else None"""
+        if self._proc is not None:
+            self.returncode = self._proc.poll()
+        elif self.returncode is None:
+            try:
+                pid, status = os.waitpid(self.pid, os.WNOHANG)
+            except ChildProcessError:
+                # Already reaped elsewhere - same convention as subprocess
+                self.returncode = 0
+            else:
+                if pid:
+                    self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+    def send_signal(self, sig):
+        """Send a signal to the process if it is still running"""
+        if self._proc is not None:
+            self._proc.send_signal(sig)
+        elif self.poll() is None:
+            os.kill(self.pid, sig)
@@ -46,9 +46,12 @@ class Orientation(IntEnum):
 
 class LcdComm(ABC):
     def __init__(self, com_port: str = "AUTO", display_width: int = 320, display_height: int = 480,
-                 update_queue: Optional[queue.Queue] = None):
+                 update_queue: Optional[queue.Queue] = None, write_timeout: Optional[float] = None):
         self.lcd_serial = None
 
+        # Seconds a serial write may block before raising SerialTimeoutException (None = block forever)
+        self.write_timeout = write_timeout
+
         # String containing absolute path to serial port e.g. "COM3", "/dev/ttyACM1" or "AUTO" for auto-discovery
         self.com_port = com_port
 
@@ -104,7 +107,8 @@ class LcdComm(ABC):
             logger.debug(f"Static COM port: {self.com_port}")
 
         try:
-            self.lcd_serial = serial.Serial(self.com_port, 115200, timeout=2, rtscts=True)
+            self.lcd_serial = serial.Serial(self.com_port, 115200, timeout=2, write_timeout=self.write_timeout,
+                                            rtscts=True)
         except Exception as e:
             logger.error(f"Cannot open COM port {self.com_port}: {e}")
             try:
@@ -151,6 +155,11 @@ class LcdComm(ABC):
                 # See https://github.com/mathoudebine/turing-smart-screen-python/issues/7
                 self.lcd_serial.flush()
         except serial.SerialTimeoutException:
+            if self.write_timeout is not None:
+                # Caller asked for bounded writes: abort the whole transfer instead of
+                # blocking write_timeout again on every remaining line. A bitmap cut short
+                # leaves the display waiting for pixel bytes - the caller must Reset() it
+                raise
             # We timed-out trying to write to our device, slow things down.
             logger.warning("(Write line) Too fast! Slow down!")
         except serial.SerialException:
@@ -56,9 +56,9 @@ class SubRevision(Enum):
 # This class is for Turing Smart Screen (rev. A) 3.5" and UsbMonitor screens (all sizes)
 class LcdCommRevA(LcdComm):
     def __init__(self, com_port: str = "AUTO", display_width: int = 320, display_height: int = 480,
-                 update_queue: Optional[queue.Queue] = None):
+                 update_queue: Optional[queue.Queue] = None, write_timeout: Optional[float] = None):
         logger.debug("HW revision: A")
-        LcdComm.__init__(self, com_port, display_width, display_height, update_queue)
+        LcdComm.__init__(self, com_port, display_width, display_height, update_queue, write_timeout)
         self.openSerial()
 
     def __del__(self):
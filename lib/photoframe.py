@@ -7,28 +7,138 @@ import os
 import time
 import random
 import threading
-from pathlib import Path
+from collections import namedtuple
+from types import SimpleNamespace
 
 # Import shared utilities
-from .debug_utils import debug_print
+from .debug_utils import debug_print, debug_enabled
 from .config_manager import config_manager
 from .constants import *
 
+# Image file extensions (lowercase, without dot) picked up by load_images
+_IMAGE_EXTENSIONS = frozenset({'jpg', 'jpeg', 'png', 'bmp', 'gif'})
+
+# Immutable snapshot of what the slideshow reads each frame; writers swap in a new one
+State = namedtuple('State', ['config', 'images', 'view'])
+
+
+def _scan_images(folder):
+    """Yield (full_path, file_name) for each image in folder, in directory order"""
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            name = entry.name
+            dot = name.rfind('.')
+            # Extension first: is_file() then rarely needs more than the dirent's d_type
+            if dot > 0 and name[dot + 1:].lower() in _IMAGE_EXTENSIONS and entry.is_file():
+                yield entry.path, name
+
+
+def _build_view(cfg):
+    """Flatten the settings used on every frame into a cheap attribute object"""
+    photos_cfg = cfg.get('photos', {}) if isinstance(cfg, dict) else {}
+    config_cfg = cfg.get('config', {}) if isinstance(cfg, dict) else {}
+    slideshow_cfg = cfg.get('slideshow', {}) if isinstance(cfg, dict) else {}
+
+    # Determine orientation (prefer photos.orientation, fallback to legacy key)
+    orientation = photos_cfg.get('orientation')
+    if orientation is None:
+        orientation = config_cfg.get('PHOTO_FRAME_ORIENTATION', 'portrait')
+
+    return SimpleNamespace(
+        orientation=str(orientation).lower(),
+        portrait_folder=photos_cfg.get('portrait_folder') or config_cfg.get('PHOTO_FRAME_FOLDER_PORTRAIT') or photos_cfg.get('portrait'),
+        landscape_folder=photos_cfg.get('landscape_folder') or config_cfg.get('PHOTO_FRAME_FOLDER_LANDSCAPE') or photos_cfg.get('landscape'),
+        # Interval - check both new and old config locations
+        interval=slideshow_cfg.get('interval') or photos_cfg.get('slideshow_interval', 30),
+        # show_time lives in slideshow section (config editor saves it there)
+        show_time=slideshow_cfg.get('show_time', True),
+        show_date=slideshow_cfg.get('show_date', False),
+    )
+
+
 class PhotoFrame:
-    def __init__(self, config_path=DEFAULT_CONFIG_PATH):
-        # Load initial configuration using config manager
+    def __init__(self, config_path=DEFAULT_CONFIG_PATH, config=None):
+        # Load initial configuration using config manager (unless the caller already parsed it)
         config_manager.config_path = config_path
-        self.config = config_manager.load_config()
+        self.config_path = config_path
+        self._config_mtime = self._stat_config()
+        self._config_mtime_racy = True  # mtime too recent to prove the file unchanged (see _config_watcher)
+        self._state = State({}, [], _build_view({}))
+        # Serializes State swaps: watcher, slideshow and tray actions all replace it
+        self._state_lock = threading.Lock()
+        if config is None:
+            config = config_manager.load_config()
         # Ensure photos section exists
-        if 'photos' not in self.config:
-            self.config['photos'] = {}
+        if 'photos' not in config:
+            config['photos'] = {}
+        self.config = config
         self.display = None
         self.running = False
-        self.current_images = []
         self.current_index = 0
         self.slideshow_thread = None
-        self._reload_lock = False  # Lock to prevent slideshow loop reload during manual operations
+        self.watcher_thread = None
+        self._stop_event = threading.Event()  # Wakes slideshow/watcher waits immediately on stop
+        self._wake_event = threading.Event()  # Wakes the slideshow wait early: stop or a config change
+        # Only the slideshow thread draws for config changes; the watcher bumps these and wakes it
+        self._config_gen = 0  # Config swaps by the watcher
+        self._images_gen = 0  # Image list swaps by the watcher
+        self._applied_config_gen = 0  # Slideshow thread's progress through the above
+        self._shown_images_gen = 0
+        # One writer at a time on the LCD's serial link (tray actions draw from their own thread)
+        self._display_lock = threading.Lock()
+        # Slideshow/watcher pause during manual operations: monotonic deadline, inf while held
+        self._reload_lock_until = 0.0
+        self._manual_frame_until = 0.0  # Monotonic deadline of a frame drawn by a manual operation
+
+    @property
+    def config(self):
+        return self._state.config
+
+    @config.setter
+    def config(self, cfg):
+        # Keep the per-frame view in sync with every config assignment
+        view = _build_view(cfg)
+        with self._state_lock:
+            self._state = self._state._replace(config=cfg, view=view)
+
+    @property
+    def view(self):
+        return self._state.view
+
+    @property
+    def current_images(self):
+        return self._state.images
+
+    @current_images.setter
+    def current_images(self, images):
+        with self._state_lock:
+            self._state = self._state._replace(images=images)
         
+    def _stat_config(self):
+        """Return config file mtime (ns), or None if it cannot be read"""
+        try:
+            return os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def hold_reload_lock(self):
+        """Pause slideshow/watcher for a manual operation; False if one is already in progress"""
+        if self._reload_locked():
+            return False
+        self._reload_lock_until = float('inf')
+        return True
+
+    def release_reload_lock(self, delay=0.0):
+        """Let slideshow/watcher resume after delay seconds (no timer thread needed)"""
+        self._reload_lock_until = time.monotonic() + delay
+
+    def _reload_locked(self):
+        return time.monotonic() < self._reload_lock_until
+
+    def _hold_manual_frame(self):
+        """Give an image a manual operation just drew a full interval before the slideshow moves on"""
+        self._manual_frame_until = time.monotonic() + self.view.interval
+
     def load_config(self):
         """Load configuration using config manager"""
         self.config = config_manager.load_config()
@@ -57,17 +167,13 @@ class PhotoFrame:
     def reload_config(self):
         """Reload configuration from disk and apply to display/slideshow."""
         debug_print("Reloading configuration...")
+        self._config_mtime = self._stat_config()
         new_cfg = config_manager.load_config(force_reload=True)
         if not new_cfg:
             debug_print("Failed to reload config; keeping previous settings", 'error')
             return False
         self.config = new_cfg
-        # Apply to display if available
-        try:
-            if self.display and hasattr(self.display, 'apply_config'):
-                self.display.apply_config(self.config)
-        except Exception as e:
-            debug_print(f"Error applying config to display: {e}", 'error')
+        self._apply_display_config()
 
         # Reload image list according to new photos.orientation
         if self.running:
@@ -79,57 +185,92 @@ class PhotoFrame:
         debug_print("Configuration reloaded")
         return True
         
-    def load_images(self, use_current_config=False):
-        """Load images from configured folder
-        
-        Args:
-            use_current_config: If True, use self.config instead of reloading from disk
-        """
-        # Use current config or read fresh from disk
-        if use_current_config:
-            fresh_cfg = self.config
-        else:
-            fresh_cfg = config_manager.load_config(force_reload=True, silent=True)
-        
-        photos_cfg = fresh_cfg.get('photos', {}) if isinstance(fresh_cfg, dict) else {}
-        config_cfg = fresh_cfg.get('config', {}) if isinstance(fresh_cfg, dict) else {}
+    def _apply_display_config(self):
+        """Apply the current config to the display (inverse etc.), if it supports that"""
+        if not (self.display and hasattr(self.display, 'apply_config')):
+            return
+        try:
+            with self._display_lock:
+                self.display.apply_config(self.config)
+        except Exception as e:
+            debug_print(f"Error applying config to display: {e}", 'error')
 
-        # Determine orientation (prefer photos.orientation, fallback to legacy key)
-        orientation = photos_cfg.get('orientation')
-        if orientation is None:
-            orientation = config_cfg.get('PHOTO_FRAME_ORIENTATION', 'portrait')
-        orientation = str(orientation).lower()
+    def _image_folder(self, use_current_config=False):
+        """Return the configured folder for the current orientation, or None if unusable"""
+        # Use current config or read fresh from disk
+        if not use_current_config:
+            # Update in-memory config to the freshly read config so subsequent flows use current values
+            self.config = config_manager.load_config(force_reload=True, silent=True)
+        view = self.view
+        orientation = view.orientation
 
         # Choose folder explicitly: portrait->portrait_folder, landscape->landscape_folder
-        if orientation.startswith('p'):
-            folder = photos_cfg.get('portrait_folder') or config_cfg.get('PHOTO_FRAME_FOLDER_PORTRAIT') or photos_cfg.get('portrait')
-        else:
-            folder = photos_cfg.get('landscape_folder') or config_cfg.get('PHOTO_FRAME_FOLDER_LANDSCAPE') or photos_cfg.get('landscape')
+        folder = view.portrait_folder if orientation.startswith('p') else view.landscape_folder
 
-        # Update in-memory config to the freshly read config so subsequent flows use current values
-        self.config = fresh_cfg
-        
         if not folder:
             debug_print("No image folder configured (portrait_folder/landscape_folder missing)", 'error')
-            return []
+            return None
 
         if not os.path.exists(folder):
             debug_print(f"Image folder not found: {folder}", 'error')
+            return None
+        return folder
+
+    def load_images(self, use_current_config=False):
+        """Load images from configured folder as (full_path, file_name) pairs
+        
+        Args:
+            use_current_config: If True, use self.config instead of reloading from disk
+        """
+        folder = self._image_folder(use_current_config)
+        if not folder:
             return []
         
         # Find all image files
-        image_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.gif'}
-        images = []
-        
-        for file_path in Path(folder).iterdir():
-            if file_path.suffix.lower() in image_extensions:
-                images.append(str(file_path))
+        images = list(_scan_images(folder))
         
         # Shuffle for random order
         random.shuffle(images)
 
-        debug_print(f"Loaded {len(images)} images from {folder} (orientation={orientation})")
+        debug_print(f"Loaded {len(images)} images from {folder} (orientation={self.view.orientation})")
         return images
+
+    def load_and_show_images(self):
+        """Reload the image list from the current config and show its first image at once
+        
+        The first image found goes to the display while the rest of the folder is
+        still being scanned, so a large folder doesn't delay the first frame.
+        The caller should hold the reload lock so the slideshow doesn't draw meanwhile.
+        Returns the number of images loaded.
+        """
+        folder = self._image_folder(use_current_config=True)
+        scan = _scan_images(folder) if folder else iter(())
+        try:
+            first = next(scan, None)
+        except OSError as e:
+            debug_print(f"Error scanning image folder {folder}: {e}", 'error')
+            first = None
+        if first is None:
+            self.current_images = []
+            return 0
+
+        self.show_current_image_now(first)
+        self._hold_manual_frame()
+
+        # Scan the rest after the first frame is out (we're on the tray's action worker already)
+        rest = []
+        try:
+            rest.extend(scan)
+        except OSError as e:
+            debug_print(f"Error scanning image folder {folder}: {e}", 'error')
+
+        # The shown image stays first; the rest play in random order after it
+        random.shuffle(rest)
+        self.current_images = [first] + rest
+        # The slideshow continues after the image already on screen, not with it again
+        self.current_index = 1 % len(self.current_images)
+        debug_print(f"Loaded {len(rest) + 1} images from {folder} (orientation={self.view.orientation})")
+        return len(rest) + 1
     
     def start_slideshow(self):
         """Start the slideshow"""
@@ -150,136 +291,220 @@ class PhotoFrame:
         
         self.running = True
         self.current_index = 0
+        self._stop_event.clear()
+        self._wake_event.clear()
         
         # Start slideshow in separate thread
         self.slideshow_thread = threading.Thread(target=self._slideshow_loop, daemon=True)
         self.slideshow_thread.start()
+
+        # Watch config file for changes (editor saves, manual edits)
+        self.watcher_thread = threading.Thread(target=self._config_watcher, daemon=True)
+        self.watcher_thread.start()
         
         debug_print(f"Photo frame slideshow started with {len(self.current_images)} images")
         return True
     
     def _slideshow_loop(self):
         """Main slideshow loop"""
+        # Pace frames against a monotonic deadline so display time doesn't add up to drift
+        next_time = time.monotonic()
         while self.running:
-            if not self.current_images:
-                break
-            
             # Skip this cycle if reload lock is active (manual operation in progress)
-            if self._reload_lock:
-                time.sleep(0.1)  # Small sleep to avoid busy loop
+            if self._reload_locked():
+                self._stop_event.wait(0.1)  # Small wait to avoid busy loop
+                next_time = time.monotonic()
                 continue
+
+            # A manual operation drew the current frame itself - let it run its interval
+            if self._manual_frame_until:
+                next_time, self._manual_frame_until = self._manual_frame_until, 0.0
+                if next_time > time.monotonic():
+                    self._wait_for_next_frame(next_time)
+                    continue
+
+            # Config the watcher picked up is applied here, so only this thread draws for it
+            if self._apply_config_changes():
+                next_time = time.monotonic()  # New image set: its first image starts a full interval
+
+            state = self._state
+            if not state.images:
+                break
             
-            # Before displaying, check if configuration changed on disk
-            # Only reload if something actually changed to avoid spam
+            # Display current image using show_current_image_now
+            self.show_current_image_now()
+            
+            # Move to next image
+            self.current_index = (self.current_index + 1) % len(state.images)
+            
+            # Wait for interval
+            next_time += state.view.interval
+            if next_time > time.monotonic():
+                self._wait_for_next_frame(next_time)
+            else:
+                # Fell behind (display slower than interval) - restart cadence instead of bursting
+                next_time = time.monotonic()
+
+    def _wait_for_next_frame(self, deadline):
+        """Sleep until deadline; return early on stop or when the watcher swapped the image list
+        
+        Config-only changes are applied while waiting, without cutting the current image short.
+        """
+        while self.running:
+            delay = deadline - time.monotonic()
+            if delay <= 0 or not self._wake_event.wait(delay):
+                return
+            self._wake_event.clear()
+            if self._images_gen != self._shown_images_gen:
+                return
+            self._apply_config_changes()
+
+    def _apply_config_changes(self):
+        """Apply config swapped in by the watcher; True if its image list changed too"""
+        config_gen, images_gen = self._config_gen, self._images_gen
+        if config_gen != self._applied_config_gen:
+            self._applied_config_gen = config_gen
+            # Display settings (e.g. inverse) are cheap to re-apply on any edit
+            self._apply_display_config()
+        if images_gen != self._shown_images_gen:
+            self._shown_images_gen = images_gen
+            self.current_index = 0
+            return True
+        return False
+    
+    def _config_watcher(self):
+        """Poll config file mtime; swap in changed config/images and let the slideshow thread draw"""
+        while not self._stop_event.wait(CONFIG_WATCH_INTERVAL):
+            # Manual operation in progress - it updates config itself, check again later
+            if self._reload_locked():
+                continue
+
+            mtime = self._stat_config()
+            if mtime == self._config_mtime and not self._config_mtime_racy:
+                continue
+            self._config_mtime = mtime
+            # FAT/exFAT store mtime in 2 s steps: a file written that recently can change again
+            # without its mtime moving, so keep re-reading (content-hashed, no parse) until it settles
+            self._config_mtime_racy = mtime is not None and time.time_ns() - mtime < CONFIG_MTIME_RESOLUTION_NS
+
             try:
                 fresh_cfg = config_manager.load_config(force_reload=True, silent=True)
-                if fresh_cfg:
+                # Unchanged content (our own save, a touch, a racy re-check) - nothing to apply
+                if fresh_cfg and fresh_cfg != self.config:
                     # Check if relevant config changed (orientation or folders)
-                    config_changed = False
-                    if self.config.get('photos', {}).get('orientation') != fresh_cfg.get('photos', {}).get('orientation'):
-                        config_changed = True
-                    if self.config.get('photos', {}).get('portrait_folder') != fresh_cfg.get('photos', {}).get('portrait_folder'):
-                        config_changed = True
-                    if self.config.get('photos', {}).get('landscape_folder') != fresh_cfg.get('photos', {}).get('landscape_folder'):
-                        config_changed = True
-                    
-                    # Only if config changed, apply it and reload images
+                    old_view, new_view = self.view, _build_view(fresh_cfg)
+                    config_changed = (
+                        (old_view.orientation, old_view.portrait_folder, old_view.landscape_folder)
+                        != (new_view.orientation, new_view.portrait_folder, new_view.landscape_folder)
+                    )
+
+                    self.config = fresh_cfg
+                    self._config_gen += 1
+
+                    # Only if orientation/folders changed, reload images (shown from the new set at once)
                     if config_changed:
                         debug_print("📋 Config changed detected - reloading images")
-                        self.config = fresh_cfg
-                        if self.display and hasattr(self.display, 'apply_config'):
-                            try:
-                                self.display.apply_config(self.config)
-                            except Exception as e:
-                                debug_print(f"Error applying config to display in loop: {e}", 'error')
-                        # Refresh the image list
                         try:
                             new_images = self.load_images(use_current_config=True)
                             if new_images:
                                 self.current_images = new_images
-                                self.current_index = 0
+                                self._images_gen += 1
                         except Exception as e:
                             debug_print(f"Error reloading image list after config change: {e}", 'error')
-                    # If nothing changed, just use fresh config silently without any logs
-                    else:
-                        self.config = fresh_cfg
+                    self._wake_event.set()
             except Exception as e:
-                debug_print(f"Error checking config in slideshow loop: {e}", 'error')
+                debug_print(f"Error checking config in watcher: {e}", 'error')
 
-            # Display current image using show_current_image_now
-            self.show_current_image_now()
-            
-            # Move to next image
-            self.current_index = (self.current_index + 1) % len(self.current_images)
-            
-            # Wait for interval - check both new and old config locations
-            interval = self.config.get('slideshow', {}).get('interval') or self.config.get('photos', {}).get('slideshow_interval', 30)
-            time.sleep(interval)
-    
     def stop_slideshow(self):
         """Stop the slideshow"""
         self.running = False
+        self._stop_event.set()
+        self._wake_event.set()
         if self.slideshow_thread:
             self.slideshow_thread.join(timeout=1)
+        if self.watcher_thread:
+            self.watcher_thread.join(timeout=1)
         debug_print("Slideshow stopped")
     
     def next_image(self):
         """Skip to next image"""
-        debug_print(f"next_image called: images={len(self.current_images) if self.current_images else 0}, running={self.running}")
-        if self.current_images and self.running:
-            self.current_index = (self.current_index + 1) % len(self.current_images)
-            debug_print(f"next_image: moved to index {self.current_index}")
+        if debug_enabled():
+            debug_print(f"next_image called: images={len(self.current_images) if self.current_images else 0}, running={self.running}")
+        images = self._state.images
+        if images and self.running:
+            self.current_index = (self.current_index + 1) % len(images)
+            if debug_enabled():
+                debug_print(f"next_image: moved to index {self.current_index}")
     
-    def show_current_image_now(self):
-        """Immediately display current image (for config changes)"""
-        if not self.current_images or not self.running or not self.display:
-            return
+    def show_current_image_now(self, image=None):
+        """Immediately display current image (for config changes)
         
-        image_path = self.current_images[self.current_index]
-        debug_print(f"Displaying: {os.path.basename(image_path)}")
+        Args:
+            image: (full_path, file_name) to show instead of the current list entry
+        """
+        state = self._state
+        if not self.running or not self.display:
+            return
+        if image is None:
+            if not state.images:
+                return
+            # Index may briefly lag a freshly swapped image list - wrap it
+            image = state.images[self.current_index % len(state.images)]
+        image_path, image_name = image
+        if debug_enabled():
+            debug_print(f"Displaying: {image_name}")
         try:
-            # Get show_time from slideshow section (config editor saves it there)
-            show_time = self.config.get('slideshow', {}).get('show_time', True)
-            show_date = self.config.get('slideshow', {}).get('show_date', False)
-            self.display.display_image_with_overlay(
-                image_path,
-                show_time=show_time,
-                show_date=show_date
-            )
+            view = state.view
+            with self._display_lock:
+                self.display.display_image_with_overlay(
+                    image_path,
+                    show_time=view.show_time,
+                    show_date=view.show_date
+                )
         except Exception as e:
             debug_print(f"Error during immediate display: {e}", 'error')
     
     def previous_image(self):
         """Go to previous image"""
-        if self.current_images and self.running:
-            self.current_index = (self.current_index - 1) % len(self.current_images)
+        images = self._state.images
+        if images and self.running:
+            self.current_index = (self.current_index - 1) % len(images)
     
     def switch_orientation(self):
         """Switch between portrait and landscape"""
-        current = self.config.get('photos', {}).get('orientation', 'landscape')
-        new_orientation = 'portrait' if current == 'landscape' else 'landscape'
-        self.config['photos']['orientation'] = new_orientation
-        
-        # Save to config file using config manager
-        try:
-            config_manager.save_config(self.config)
-            debug_print(f"Saved orientation change to config: {new_orientation}")
-            # Force reload to ensure consistency
-            self.config = config_manager.load_config(force_reload=True)
-        except Exception as e:
-            debug_print(f"Error saving orientation to config: {e}", 'error')
-        
-        # Apply config to display
+        # Pause slideshow/watcher so the watcher can't reload between the save and the image reload
+        if not self.hold_reload_lock():
+            print("⏱️ Reload already in progress, ignoring orientation switch")
+            return
         try:
-            if self.display and hasattr(self.display, 'apply_config'):
-                self.display.apply_config(self.config)
-        except Exception as e:
-            print(f"Error applying config to display: {e}")
-        
-        # Reload images and show immediately (use current config already set above)
-        if self.running:
-            self.current_images = self.load_images(use_current_config=True)
-            self.current_index = 0
-            self.show_current_image_now()
+            current = self.config.get('photos', {}).get('orientation', 'landscape')
+            new_orientation = 'portrait' if current == 'landscape' else 'landscape'
+            # Build a new config instead of mutating the one readers may hold
+            new_cfg = dict(self.config)
+            new_cfg['photos'] = {**new_cfg.get('photos', {}), 'orientation': new_orientation}
+            self.config = new_cfg
+            
+            # Save to config file using config manager
+            try:
+                config_manager.save_config(new_cfg)
+                debug_print(f"Saved orientation change to config: {new_orientation}")
+                # Force reload to ensure consistency
+                self.config = config_manager.load_config(force_reload=True)
+            except Exception as e:
+                debug_print(f"Error saving orientation to config: {e}", 'error')
+            
+            self._apply_display_config()
             
-        debug_print(f"Switched to {new_orientation} orientation")
\ No newline at end of file
+            # Reload images and show immediately (use current config already set above)
+            if self.running:
+                self.current_images = self.load_images(use_current_config=True)
+                self.current_index = 0
+                self.show_current_image_now()
+                if self.current_images:
+                    self.current_index = 1 % len(self.current_images)
+                    self._hold_manual_frame()
+                
+            debug_print(f"Switched to {new_orientation} orientation")
+        finally:
+            # Lock expires on its own after the grace period
+            self.release_reload_lock(RELOAD_LOCK_GRACE)
@@ -0,0 +1,77 @@
+"""
+Cached YAML loading and atomic saving for PhotoFrame configuration files
+Parsed files are kept in a small LRU keyed by path and validated by a hash of their bytes
+"""
+
+import copy
+import os
+import threading
+from collections import OrderedDict
+
+import yaml
+
+from .constants import YAML_CACHE_MAX_ENTRIES
+from .yaml_sidecar import content_digest, load_via_sidecar, record_written, write_atomic
+
+# libyaml C implementations when PyYAML was built with them (several times faster).
+# Binary PyYAML wheels include them; a source build needs the libyaml headers installed.
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# Parsed YAML per absolute path: (digest, config), least recently used first.
+# Callers always get deep copies.
+_CACHE = OrderedDict()
+_CACHE_LOCK = threading.Lock()  # Slideshow, watcher and tray threads all load configs
+
+
+def _store(key, entry):
+    """Insert or refresh a cache entry, evicting the least recently used past the limit"""
+    with _CACHE_LOCK:
+        _CACHE[key] = entry
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > YAML_CACHE_MAX_ENTRIES:
+            _CACHE.popitem(last=False)
+
+
+def load_yaml_cached(path):
+    """Parse a YAML file, reusing the last result while its contents are unchanged
+
+    The file is read on every call (a few KB) and only changed bytes cost a parse.
+    mtime + size can't be trusted as the key: FAT/exFAT SD cards store mtime in
+    2 s steps, so a same-size edit within one step would look unchanged.
+    Returns a deep copy the caller may modify.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    digest = content_digest(raw)
+    key = os.path.abspath(path)
+    cached = _CACHE.get(key)
+    if cached is None or cached[0] != digest:
+        cached = (digest, load_via_sidecar(path, raw, digest, _parse_yaml))
+    _store(key, cached)
+    return copy.deepcopy(cached[1])
+
+
+def _remember_yaml(path, config):
+    """Record a config we just wrote so the next load (here or in the editor) doesn't re-parse it"""
+    key = os.path.abspath(path)
+    digest = record_written(path, config)
+    if digest is None:
+        with _CACHE_LOCK:
+            _CACHE.pop(key, None)
+        return
+    _store(key, (digest, copy.deepcopy(config)))
+
+
+def save_yaml(path, config, **dump_options):
+    """Serialize config and write it atomically, keeping the parse cache in step"""
+    data = yaml.dump(config, Dumper=SafeDumper, **dump_options)
+    write_atomic(path, data)
+    _remember_yaml(path, config)
+
+
+def _parse_yaml(raw):
+    # The loader detects the encoding (UTF-8 by default) itself
+    return yaml.load(raw, Loader=SafeLoader) or {}
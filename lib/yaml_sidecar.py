@@ -0,0 +1,91 @@
+"""
+Content digest, JSON sidecar and atomic writes for cached YAML files
+Shared by lib/yaml_cache.py and tools/config_editor.py, which both read and write the
+<file>.cache.json sidecar. Imports no PyYAML, so the editor can start without it.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+
+def content_digest(raw):
+    """Content key for a file's bytes"""
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def sidecar_path(path):
+    """<path>.cache.json"""
+    return f"{os.fspath(path)}.cache.json"
+
+
+def read_sidecar(path, digest):
+    """Config stored in path's sidecar if it was made from the YAML with this digest, else None"""
+    try:
+        with open(sidecar_path(path), 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached['source'] == digest:
+            return cached['config']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # Missing, stale or corrupt sidecar - caller parses the YAML
+    return None
+
+
+def write_sidecar(path, digest, config):
+    """Record config as the parse of the YAML with this digest (best-effort)"""
+    try:
+        data = json.dumps({'source': digest, 'config': config})
+        # Only cache configs that survive a JSON round trip unchanged (no dates, int keys...)
+        if json.loads(data)['config'] == config:
+            write_atomic(sidecar_path(path), data)
+    except (OSError, TypeError, ValueError):
+        pass  # Caching is best-effort
+
+
+def load_via_sidecar(path, raw, digest, parse):
+    """Config for a YAML file's bytes: from its sidecar while they are unchanged, else parse(raw)
+
+    JSON parses far faster than YAML, which matters on slow boards at startup.
+    A fresh parse is recorded in the sidecar for the next reader, in either process.
+    """
+    config = read_sidecar(path, digest)
+    if config is None:
+        config = parse(raw)
+        write_sidecar(path, digest, config)
+    return config
+
+
+def record_written(path, config):
+    """Sidecar a config just saved to path; returns the file's digest, or None if unreadable"""
+    try:
+        # Hash what actually landed on disk (text mode may have translated newlines)
+        with open(path, 'rb') as f:
+            digest = content_digest(f.read())
+    except OSError:
+        return None
+    write_sidecar(path, digest, config)
+    return digest
+
+
+def write_atomic(path, data):
+    """Write text to a temp file next to path, fsync it and rename it over path
+
+    The temp name is unique per writer: the tray and the editor can save config.yaml
+    (and its sidecar) at the same moment, and a shared <path>.tmp would let one
+    rename the other's half-written file into place.
+    """
+    path = os.fspath(path)
+    tmp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -6,20 +6,72 @@ import sys
 import os
 import time
 import signal
-import subprocess
+import select
+import socket
+import queue
+import importlib
+import copy
 import threading
 import yaml
-from pathlib import Path
 
 # Import shared utilities
 from lib.debug_utils import debug_print
+from lib.config_manager import config_manager
+from lib.yaml_cache import load_yaml_cached, save_yaml
 from lib.constants import *
-from PIL import Image
-import pystray
 
 from lib.display import LCDDisplay
+from lib.fast_popen import FastPopen
+from lib.instance_lock import InstanceLock
 from lib.photoframe import PhotoFrame
 
+# Paths resolved once at import instead of on every tray event
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+_TOOLS_DIR = os.path.join(_ROOT, 'tools')
+_CONFIG_EDITOR = os.path.join(_TOOLS_DIR, 'config_editor.py')
+_CONFIG_YAML = os.path.join(_ROOT, DEFAULT_CONFIG_PATH)
+_PORTRAIT_HISTORY = os.path.join(_ROOT, PORTRAIT_HISTORY_FILE)
+_LANDSCAPE_HISTORY = os.path.join(_ROOT, LANDSCAPE_HISTORY_FILE)
+_CONFIG_EDITOR_LOCK = os.path.join(_ROOT, '.config_editor.lock')
+_ICON_PATH = os.path.join(_ROOT, 'res', 'icons', 'photoframe-photos', '64.png')
+
+_CLICK_COOLDOWN_NS = int(TRAY_CLICK_COOLDOWN * 1_000_000_000)
+
+# (pystray, PIL.Image) after the first successful import, False if unavailable
+_tray_modules = None
+
+
+def _first_history_entry(path):
+    """Return the first non-empty line of a history file (the default folder), or None"""
+    # Only the default is ever needed, so stop reading at the first entry
+    with open(path, 'r', encoding='utf-8') as f:
+        return next((line.strip() for line in f if line.strip()), None)
+
+
+# Per orientation: (photos folder key, config folder key, config history-line key)
+_DEFAULT_FOLDER_KEYS = {
+    'portrait': ('portrait_folder', 'PHOTO_FRAME_FOLDER_PORTRAIT', 'PORTRAIT_HISTORY_LINE'),
+    'landscape': ('landscape_folder', 'PHOTO_FRAME_FOLDER_LANDSCAPE', 'LANDSCAPE_HISTORY_LINE'),
+}
+
+
+def _set_default_folder(cfg, orientation, folder):
+    """Point an orientation's folder settings at folder and reset its history index to 0"""
+    photos_key, folder_key, line_key = _DEFAULT_FOLDER_KEYS[orientation]
+    cfg.setdefault('photos', {})[photos_key] = folder
+    cfg.setdefault('config', {}).update({folder_key: folder, line_key: 0})
+
+
+def _load_tray_modules():
+    """Import the tray dependencies once; returns (pystray, Image) or None"""
+    global _tray_modules
+    if _tray_modules is None:
+        try:
+            _tray_modules = (importlib.import_module('pystray'), importlib.import_module('PIL.Image'))
+        except ImportError:
+            _tray_modules = False
+    return _tray_modules or None
+
 
 class PhotoFrameApp:
     def __init__(self):
@@ -28,25 +80,39 @@ class PhotoFrameApp:
         self.photoframe = None
 
         # Running state
-        self.running = True
+        self._stop_event = threading.Event()  # Set by shutdown(); ends the run() wait
+        self._shutdown_lock = threading.Lock()  # Held forever once shutdown starts
+        self._wakeup_sock = None  # Write end of run()'s wakeup socketpair while the app runs
 
         # Tray/icon state
         self.tray_icon = None
-        self.tray_thread = None
-
-        # Configuration editor state
-        self._config_open = False
+        self._tray_icon_image = None  # Decoded once; reused if the tray is rebuilt
+        
+        # Configuration editor state: running child and the lock file held for it
         self._config_process = None
+        self._config_lock = None
         
-        # Icon click throttling (1 second cooldown)
-        self._click_lock = threading.Lock()
-        self._last_click_time = 0.0
+        # Tray actions (disk, LCD, editor launch) run on one worker so the tray thread stays responsive
+        self._action_queue = queue.SimpleQueue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+
+        # Icon click throttling (TRAY_CLICK_COOLDOWN)
+        self._last_click_ns = None  # time.monotonic_ns() of the last accepted click
+
+        # History file path -> (mtime_ns, size, first entry); clicks skip re-reading unchanged files
+        self._history_defaults = {}
+
+    @property
+    def running(self):
+        """True until shutdown() starts"""
+        return not self._stop_event.is_set()
 
     def initialize(self):
         """Initialize the display and photoframe components."""
         try:
             # Load default folders from history and update config
-            self._initialize_default_folders()
+            cfg = self._initialize_default_folders()
             
             # Initialize display
             self.display = LCDDisplay()
@@ -55,7 +121,7 @@ class PhotoFrameApp:
                 return False
 
             # Initialize photoframe and attach display
-            self.photoframe = PhotoFrame("tools/config.yaml")
+            self.photoframe = PhotoFrame(_CONFIG_YAML, config=cfg)
             self.photoframe.set_display(self.display)
 
             debug_print("✅ Initialization complete")
@@ -65,170 +131,191 @@ class PhotoFrameApp:
             return False
     
     def _initialize_default_folders(self):
-        """Load top folders from history files and save their indices to config"""
+        """Load top folders from history files and save their indices to config
+        
+        Returns the resulting config dict (None on error) so callers can skip re-reading it.
+        """
         try:
-            import yaml
-            from pathlib import Path
-            
-            tools_dir = Path(__file__).parent / "tools"
-            portrait_history_file = tools_dir / "portrait_folders_history.txt"
-            landscape_history_file = tools_dir / "landscape_folders_history.txt"
-            config_file = tools_dir / "config.yaml"
-            
-            # Load history files
-            portrait_history = []
-            landscape_history = []
-            
-            if portrait_history_file.exists():
-                with portrait_history_file.open("r", encoding="utf-8") as f:
-                    portrait_history = [line.strip() for line in f.readlines() if line.strip()]
-                    
-            if landscape_history_file.exists():
-                with landscape_history_file.open("r", encoding="utf-8") as f:
-                    landscape_history = [line.strip() for line in f.readlines() if line.strip()]
+            # Default folder = first entry of each history file
+            portrait_default = self._history_default(_PORTRAIT_HISTORY)
+            landscape_default = self._history_default(_LANDSCAPE_HISTORY)
             
             # Load existing config
             cfg = {}
-            if config_file.exists():
-                with config_file.open("r", encoding="utf-8") as f:
-                    cfg = yaml.safe_load(f) or {}
+            if os.path.exists(_CONFIG_YAML):
+                cfg = load_yaml_cached(_CONFIG_YAML)
+            original = copy.deepcopy(cfg)
             
-            if 'config' not in cfg:
-                cfg['config'] = {}
-            if 'photos' not in cfg:
-                cfg['photos'] = {}
+            cfg.setdefault('config', {})
+            cfg.setdefault('photos', {})
             
             # Set default folders (first from history) and indices
-            if portrait_history:
-                cfg['photos']['portrait_folder'] = portrait_history[0]
-                cfg['config']['PHOTO_FRAME_FOLDER_PORTRAIT'] = portrait_history[0]
-                cfg['config']['PORTRAIT_HISTORY_LINE'] = 0
-                debug_print(f"📁 Default portrait folder: {portrait_history[0]}")
+            if portrait_default:
+                _set_default_folder(cfg, 'portrait', portrait_default)
+                debug_print(f"📁 Default portrait folder: {portrait_default}")
                 
-            if landscape_history:
-                cfg['photos']['landscape_folder'] = landscape_history[0] 
-                cfg['config']['PHOTO_FRAME_FOLDER_LANDSCAPE'] = landscape_history[0]
-                cfg['config']['LANDSCAPE_HISTORY_LINE'] = 0
-                debug_print(f"📁 Default landscape folder: {landscape_history[0]}")
+            if landscape_default:
+                _set_default_folder(cfg, 'landscape', landscape_default)
+                debug_print(f"📁 Default landscape folder: {landscape_default}")
             
-            # Save updated config
-            with config_file.open("w", encoding="utf-8") as f:
-                yaml.safe_dump(cfg, f, sort_keys=False)
+            # Nothing to do when the defaults are already stored (the usual restart case)
+            if cfg != original:
+                # Save updated config (temp file + rename, so readers never see a torn file)
+                save_yaml(_CONFIG_YAML, cfg, sort_keys=False)
+            return cfg
                 
         except (FileNotFoundError, yaml.YAMLError, PermissionError) as e:
             debug_print(f"Error accessing config files: {e}", 'error')
         except Exception as e:
             debug_print(f"Unexpected error initializing default folders: {e}", 'error')
     
+    def _history_default(self, path):
+        """First entry of a history file, re-read only when the file changes; None if missing"""
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        cached = self._history_defaults.get(path)
+        if cached is None or cached[0] != st.st_mtime_ns or cached[1] != st.st_size:
+            cached = (st.st_mtime_ns, st.st_size, _first_history_entry(path))
+            self._history_defaults[path] = cached
+        return cached[2]
+    
+    def _accept_click(self):
+        """Return True if a tray click is outside the cooldown window, and start a new window"""
+        # pystray dispatches menu callbacks one at a time on the tray thread,
+        # so the cooldown timestamp needs no lock
+        # Integer nanoseconds: immune to wall-clock jumps, no float rounding
+        current_ns = time.monotonic_ns()
+        
+        # Log every attempt to click
+        print(f"🖱️ Tray icon clicked at {current_ns / 1e9:.3f}")
+        
+        if self._last_click_ns is not None:
+            since_last_ns = current_ns - self._last_click_ns
+            if since_last_ns < _CLICK_COOLDOWN_NS:
+                print(f"⏱️ Click ignored (cooldown active, {since_last_ns / 1e9:.2f}s since last)")
+                return False
+        
+        # Update last click time BEFORE executing so repeated clicks fall into the cooldown
+        self._last_click_ns = current_ns
+        return True
+    
+    def _worker_loop(self):
+        """Run queued actions one at a time, off the pystray thread, until None arrives"""
+        get = self._action_queue.get
+        while True:
+            try:
+                # While an editor is open, wake now and then so it is reaped once closed
+                action = get(timeout=EDITOR_REAP_INTERVAL if self._config_process is not None else None)
+            except queue.Empty:
+                self._reap_config_editor()
+                continue
+            if action is None:
+                break
+            try:
+                action()
+            except Exception as e:
+                debug_print(f"Error in tray action: {e}", 'error')
+    
     def tray_icon_clicked(self, icon, item):
-        """Handler for tray icon click - switches to default folders with 1-second cooldown"""
+        """Handler for tray icon click - switches to default folders with a short cooldown"""
         try:
-            current_time = time.time()
-            
-            # Log every attempt to click
-            print(f"🖱️ Tray icon clicked at {current_time}")
-            
-            # Try to acquire lock without blocking - if can't acquire, another click is processing
-            if not self._click_lock.acquire(blocking=False):
-                debug_print("⏱️ Click ignored (already processing)")
-                print("⏱️ Click ignored (already processing)")
+            if not self._accept_click():
                 return
-            
-            try:
-                # Check if within cooldown period (1 second)
-                time_since_last = current_time - self._last_click_time
-                if time_since_last < 1.0:
-                    debug_print(f"⏱️ Click ignored (cooldown active, {time_since_last:.2f}s since last)")
-                    print(f"⏱️ Click ignored (cooldown active, {time_since_last:.2f}s since last)")
-                    return
-                
-                # Update last click time BEFORE executing to block concurrent clicks
-                self._last_click_time = current_time
-                
-                # Execute switch to default folder
-                debug_print("🖱️ Tray icon clicked - switching to default folder")
-                print("✅ Processing click - switching to default folder")
-                self.switch_to_default_folder()
-                print("✅ Finished switching to default folder")
-                
-            finally:
-                self._click_lock.release()
+            self._action_queue.put_nowait(self._switch_to_default_folder_clicked)
             
         except Exception as e:
-            debug_print(f"Error handling tray icon click: {e}", 'error')
             print(f"❌ Error handling tray icon click: {e}")
     
+    def _switch_to_default_folder_clicked(self):
+        """Tray worker: execute switch to default folder"""
+        print("✅ Processing click - switching to default folder")
+        self.switch_to_default_folder()
+        print("✅ Finished switching to default folder")
+    
     def switch_orientation(self, icon, item):
         """Tray menu: Switch orientation"""
         debug_print("🖱️ Switch orientation clicked in tray")
         if self.photoframe:
-            self.photoframe.switch_orientation()
+            self._action_queue.put_nowait(self._switch_orientation_action)
         else:
             print("❌ No photoframe instance")
 
+    def _switch_orientation_action(self):
+        """Tray worker: switch orientation, then show the saved change in an open editor"""
+        self.photoframe.switch_orientation()
+        self._refresh_config_editor()
+
     def _open_config_menu_only(self, icon, item):
         """Handler only for menu item - opens config immediately"""
         debug_print("⚙️ Configuration opened from menu")
-        # Clean up any previous process state
-        if self._config_process:
-            try:
-                if self._config_process.poll() is None:
-                    print("⚙️ Configuration already open")
-                    return
-                else:
-                    # Process finished, clean up
-                    self._config_process = None
-                    self._config_open = False
-            except Exception:
-                self._config_process = None
-                self._config_open = False
-        
-        if not self._config_open:
-            threading.Thread(target=self._open_config_action, daemon=True).start()
-        else:
+        if self._editor_running():
             print("⚙️ Configuration already open")
+            return
+        self._action_queue.put_nowait(self._open_config_action)
+
+    def _editor_running(self):
+        """True while the editor we launched is alive (poll() also reaps it once it exits)"""
+        proc = self._config_process
+        return proc is not None and proc.poll() is None
+
+    def _reap_config_editor(self):
+        """Action worker: once the editor has exited, reap it and drop its lock file."""
+        if self._config_process is None or self._editor_running():
+            return
+        debug_print("⚙️ Configuration editor closed")
+        self._config_process = None
+        if self._config_lock is not None:
+            self._config_lock.release()
+            self._config_lock = None
 
     def _open_config_action(self):
-        """Actually open the configuration editor and track its process so only one opens."""
+        """Launch the configuration editor (one at a time) without waiting for it.
+
+        The slideshow's config watcher applies whatever the editor saves, so no
+        thread has to sit in wait() until the editor closes.
+        """
         try:
-            root = os.path.dirname(__file__)
-            local_editor = os.path.join(root, 'tools', 'config_editor.py')
-            if os.path.exists(local_editor):
-                try:
-                    proc = subprocess.Popen([sys.executable, local_editor], cwd=root)
-                    self._config_process = proc
-                    self._config_open = True
-                    debug_print("⚙️  Configuration editor opened (tools/config_editor.py)")
-                    # Wait for process to exit
-                    try:
-                        proc.wait()
-                    except Exception:
-                        pass
-                    debug_print("⚙️ Configuration editor closed")
-                    # Reload configuration after editor closes
-                    self.reload_config()
-                finally:
-                    self._config_process = None
-                    self._config_open = False
-            else:
+            self._reap_config_editor()
+            if self._config_process is not None:
+                print("⚙️ Configuration already open")
+                return
+
+            if not os.path.exists(_CONFIG_EDITOR):
                 print("⚠️  Configuration editor not found (expected tools/config_editor.py)")
+                return
+
+            # OS-level lock, held while the editor runs: another launch can't also win it
+            lock = InstanceLock(_CONFIG_EDITOR_LOCK)
+            if not lock.acquire():
+                print("⚙️ Configuration already open")
+                return
+            try:
+                # No cwd: the editor resolves its paths from __file__, and leaving the
+                # directory alone lets FastPopen use posix_spawn
+                proc = FastPopen([sys.executable, _CONFIG_EDITOR])
+            except Exception:
+                lock.release()
+                raise
+            lock.write_pid(proc.pid)
+            self._config_process, self._config_lock = proc, lock
+            debug_print("⚙️  Configuration editor opened (tools/config_editor.py)")
         except Exception as e:
             print(f"❌ Failed to open configuration: {e}")
 
     def exit_app(self, icon, item):
         """Tray menu: Exit application"""
         debug_print("🛑 Exiting application...")
+        # Also stops the tray icon, which returns run() on the main thread
         self.shutdown()
-        # Stop the tray icon which will end the application
-        if hasattr(icon, 'stop'):
-            icon.stop()
 
     def reload_config(self):
         """Trigger reload of configuration in PhotoFrame and Display."""
         try:
             if self.photoframe:
                 ok = self.photoframe.reload_config()
-                debug_print("Reload config:", "OK" if ok else "Failed")
+                debug_print(f"Reload config: {'OK' if ok else 'Failed'}")
                 # Do not refresh configuration editor - it was closed by user
             else:
                 print("No photoframe instance to reload config")
@@ -236,16 +323,19 @@ class PhotoFrameApp:
             print(f"Error reloading config: {e}")
 
     def _refresh_config_editor(self):
-        """Refresh the configuration editor to reflect updated settings."""
+        """Ask the running configuration editor to re-read its settings (SIGUSR1).
+
+        Called after the tray saves config.yaml itself, so an open editor shows the
+        change instead of writing its stale form back over it on Save.
+        """
+        proc = self._config_process
+        # No editor open, or no SIGUSR1 (Windows): nothing to do on every tray click
+        if not self._editor_running() or not hasattr(signal, 'SIGUSR1'):
+            return
         try:
-            root = os.path.dirname(__file__)
-            local_editor = os.path.join(root, 'tools', 'config_editor.py')
-            if os.path.exists(local_editor):
-                subprocess.Popen([sys.executable, local_editor, '--refresh'], cwd=root)
-                print("⚙️ Configuration editor refreshed")
-            else:
-                print("⚠️ Configuration editor not found")
-        except Exception as e:
+            proc.send_signal(signal.SIGUSR1)
+            print("⚙️ Configuration editor refreshed")
+        except OSError as e:
             print(f"❌ Failed to refresh configuration editor: {e}")
 
     def switch_to_default_folder(self, icon=None, item=None):
@@ -255,40 +345,29 @@ class PhotoFrameApp:
                 debug_print("No photoframe instance available")
                 return
             
-            # Check if lock is active - if yes, exit
-            if self.photoframe._reload_lock:
+            # Set lock to block slideshow loop - if it is already held, exit
+            if not self.photoframe.hold_reload_lock():
                 print("⏱️ Reload already in progress, ignoring click")
                 return
-            
-            # Set lock to block slideshow loop
-            self.photoframe._reload_lock = True
             print("🔒 Lock set - blocking slideshow loop")
             
             try:
-                # Get current orientation from config
-                config = self.photoframe.load_config()
+                # Work on a private copy of the live config: readers may hold the current
+                # one, and the watcher keeps it in step with the file, so no disk read is needed
+                config = copy.deepcopy(self.photoframe.config)
                 current_orientation = config.get('photos', {}).get('orientation', 'portrait').lower()
                 
                 # Read appropriate history file - ALWAYS use first line (default)
                 if current_orientation.startswith('p'):  # portrait
-                    history_file = Path("tools/portrait_folders_history.txt")
+                    orientation_key, history_file = 'portrait', _PORTRAIT_HISTORY
                 else:  # landscape
-                    history_file = Path("tools/landscape_folders_history.txt")
+                    orientation_key, history_file = 'landscape', _LANDSCAPE_HISTORY
                 
-                if not history_file.exists():
-                    debug_print(f"History file not found: {history_file}")
-                    return
-                    
-                # Read first line (default folder)
-                with open(history_file, 'r', encoding='utf-8') as f:
-                    lines = [line.strip() for line in f.readlines() if line.strip()]
-                    
-                if not lines:
-                    debug_print(f"No folders in history file: {history_file}")
-                    return
-                    
                 # ALWAYS use first folder from history (index 0)
-                default_folder = lines[0]
+                default_folder = self._history_default(history_file)
+                if not default_folder:
+                    debug_print(f"No folders in history file (or file missing): {history_file}")
+                    return
                 
                 if not os.path.exists(default_folder):
                     debug_print(f"Default folder does not exist: {default_folder}")
@@ -297,19 +376,12 @@ class PhotoFrameApp:
                 print(f"🔄 Setting default {current_orientation} folder: {default_folder}")
                 
                 # Update config with default folders from history (first paths)
-                if current_orientation.startswith('p'):  # portrait
-                    config['photos']['portrait_folder'] = default_folder
-                    config['config']['PHOTO_FRAME_FOLDER_PORTRAIT'] = default_folder
-                    config['config']['PORTRAIT_HISTORY_LINE'] = 0
-                else:  # landscape
-                    config['photos']['landscape_folder'] = default_folder
-                    config['config']['PHOTO_FRAME_FOLDER_LANDSCAPE'] = default_folder
-                    config['config']['LANDSCAPE_HISTORY_LINE'] = 0
+                _set_default_folder(config, orientation_key, default_folder)
                 
                 # Save config
-                from lib.config_manager import config_manager
                 if config_manager.save_config(config):
                     print(f"✅ Config saved with default folder")
+                    self._refresh_config_editor()
                 else:
                     print(f"❌ Failed to save config")
                     return
@@ -319,26 +391,20 @@ class PhotoFrameApp:
                 
                 # Reload images from location in config (use current config, already set above)
                 if self.photoframe.running:
-                    self.photoframe.current_images = self.photoframe.load_images(use_current_config=True)
-                    self.photoframe.current_index = 0
-                    # Load first image immediately
-                    self.photoframe.show_current_image_now()
-                    print(f"✅ Loaded {len(self.photoframe.current_images)} images from default folder")
+                    # First image is drawn while the rest of the folder is still being scanned
+                    count = self.photoframe.load_and_show_images()
+                    print(f"✅ Loaded {count} images from default folder")
                     
             finally:
-                # Release lock after 1 second
-                def release_lock():
-                    time.sleep(1.0)
-                    self.photoframe._reload_lock = False
-                    print("🔓 Lock released after 1 second")
-                
-                threading.Thread(target=release_lock, daemon=True).start()
+                # Lock expires on its own after the grace period - no release thread
+                self.photoframe.release_reload_lock(RELOAD_LOCK_GRACE)
+                print(f"🔓 Lock released in {RELOAD_LOCK_GRACE:g} second(s)")
             
         except Exception as e:
-            debug_print(f"❌ Error switching to default folder: {e}", 'error')
-            print(f"❌ Error: {e}")
+            print(f"❌ Error switching to default folder: {e}")
             # Ensure lock is released on error
-            self.photoframe._reload_lock = False
+            if self.photoframe:
+                self.photoframe.release_reload_lock()
     
     def start_slideshow(self):
         """Start the photo slideshow"""
@@ -352,8 +418,15 @@ class PhotoFrameApp:
     
     def shutdown(self):
         """Shutdown application"""
+        # Tray exit and signal handlers can both get here - only the first one tears down
+        if not self._shutdown_lock.acquire(blocking=False):
+            return
         debug_print("🛑 Shutting down...")
-        self.running = False
+        self._stop_event.set()
+        self._wake_main_thread()
+        # Let the worker reap an editor that already closed (not leave its pid in the lock file), then exit
+        self._action_queue.put_nowait(self._reap_config_editor)
+        self._action_queue.put_nowait(None)
         
         # Stop slideshow
         if self.photoframe:
@@ -369,8 +442,40 @@ class PhotoFrameApp:
         
         debug_print("✅ Shutdown complete")
     
+    def _wake_main_thread(self):
+        """Nudge _relay_wakeups' select so it notices shutdown (which may come from a tray thread)"""
+        wsock = self._wakeup_sock
+        if wsock is not None:
+            try:
+                wsock.send(b'\0')
+            except OSError:
+                pass  # Buffer full (already woken) or socket closed
+    
+    def _relay_wakeups(self, rsock):
+        """Shut down on SIGINT/SIGTERM even while the main thread sits in the tray's loop
+        
+        Python-level handlers only run once the main thread executes bytecode again, which
+        it doesn't while blocked in the tray backend's native loop (Win32 GetMessage, GTK).
+        The C-level handler still writes the signal number to the wakeup fd at once, so
+        this thread calls signal_handler itself; shutdown() then stops the tray icon,
+        which returns the main thread from run().
+        """
+        while not self._stop_event.is_set():
+            select.select([rsock], [], [])
+            try:
+                data = rsock.recv(4096)
+            except BlockingIOError:
+                continue
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                if signum in data:
+                    self.signal_handler(signum, None)
+                    break
+    
     def signal_handler(self, signum, frame):
         """Handle system signals"""
+        # The wakeup relay usually gets here first; the deferred Python-level call is then a no-op
+        if self._stop_event.is_set():
+            return
         print(f"📡 Received signal {signum}")
         self.shutdown()
     
@@ -390,40 +495,75 @@ class PhotoFrameApp:
         
         debug_print("🖼️  Photo Frame is running... (Press Ctrl+C to stop)")
         
+        # Signals reach _relay_wakeups through this socketpair (set_wakeup_fd), as does shutdown().
+        # A socketpair rather than a pipe: Windows select() and set_wakeup_fd only take sockets
+        rsock, wsock = socket.socketpair()
+        rsock.setblocking(False)
+        wsock.setblocking(False)
+        old_fd = signal.set_wakeup_fd(wsock.fileno())
+        self._wakeup_sock = wsock
+        relay = threading.Thread(target=self._relay_wakeups, args=(rsock,), daemon=True)
+        relay.start()
+
         # Keep main thread alive
         try:
-            # Setup tray icon (best-effort)
-            try:
-                self._setup_tray()
-            except Exception:
-                pass
+            # Setup tray icon (best-effort, reports its own failures)
+            self._setup_tray()
+
+            # Pump tray messages on the main thread (Win32 needs it there);
+            # shutdown() stops the icon, which returns from run()
+            if self.tray_icon and not self._stop_event.is_set():
+                try:
+                    debug_print("✅ Tray icon started")
+                    self.tray_icon.run()
+                except Exception as e:
+                    print(f"⚠️  Tray icon run failed: {e}")
 
-            while self.running:
-                time.sleep(1)
+            # No tray (or it stopped on its own) - the relay thread exits once shutdown() is called
+            relay.join()
         except KeyboardInterrupt:
             print("\n⌨️  Keyboard interrupt received")
             self.shutdown()
+        finally:
+            self._wakeup_sock = None
+            signal.set_wakeup_fd(old_fd)
+            rsock.close()
+            wsock.close()
 
         return True
 
     def _setup_tray(self):
-        """Create and start the tray icon (best-effort)."""
+        """Create the tray icon (best-effort); run() drives it on the main thread."""
         try:
-            # Ensure pystray and PIL Image are available
-            if 'pystray' not in globals() or 'Image' not in globals():
+            # Headless (e.g. service without a desktop session): no tray, and skip the costly import
+            if not (sys.platform in ('win32', 'darwin')
+                    or os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY')):
+                debug_print("No desktop session; running without tray icon")
+                return
+
+            # Imported on first use so headless runs never load the tray backend
+            modules = _load_tray_modules()
+            if not modules:
                 print("⚠️  pystray or PIL not available; skipping tray icon")
                 return
+            pystray, Image = modules
 
-            icon_path = os.path.join(os.path.dirname(__file__), 'res', 'icons', 'photoframe-photos', '64.png')
-            icon_image = None
-            try:
-                if os.path.exists(icon_path):
-                    icon_image = Image.open(icon_path)
-                else:
+            icon_image = self._tray_icon_image
+            if icon_image is None:
+                try:
+                    # Decode now - Image.open is lazy and would hit disk on the first tray repaint
+                    with Image.open(_ICON_PATH) as img:
+                        img.load()
+                        icon_image = img.convert('RGBA')
+                    # Scale a larger asset down once so the tray never rescales it on repaint
+                    if icon_image.width > TRAY_ICON_SIZE[0] or icon_image.height > TRAY_ICON_SIZE[1]:
+                        icon_image.thumbnail(TRAY_ICON_SIZE, Image.LANCZOS)
+                except OSError:  # missing, unreadable or not an image (PIL raises OSError subclasses)
+                    icon_image = None
+                if icon_image is None:
                     # create a simple transparent placeholder
-                    icon_image = Image.new('RGBA', (64, 64), (0, 0, 0, 0))
-            except Exception:
-                icon_image = Image.new('RGBA', (64, 64), (0, 0, 0, 0))
+                    icon_image = Image.new('RGBA', TRAY_ICON_SIZE, TRANSPARENT)
+                self._tray_icon_image = icon_image
 
             menu = pystray.Menu(
                 pystray.MenuItem('Switch to Default Folder', self.tray_icon_clicked, default=True, visible=False),
@@ -435,30 +575,16 @@ class PhotoFrameApp:
             # Create icon
             try:
                 self.tray_icon = pystray.Icon('PhotoFrame', icon_image, 'Photo Frame - Running', menu=menu)
-            except Exception as e:
+            except TypeError as e:
                 # Older pystray variants may accept different args
                 try:
                     self.tray_icon = pystray.Icon('PhotoFrame', icon_image)
                     self.tray_icon.title = 'Photo Frame - Running'
                     self.tray_icon.menu = menu
-                except Exception as e2:
+                except (TypeError, AttributeError) as e2:
                     print(f"⚠️  Failed to create tray icon object: {e} / {e2}")
                     self.tray_icon = None
 
-            if not self.tray_icon:
-                return
-
-            # Start the tray icon (use run_detached when available)
-            try:
-                if hasattr(self.tray_icon, 'run_detached'):
-                    self.tray_icon.run_detached()
-                    debug_print("✅ Tray icon started (detached)")
-                else:
-                    self.tray_thread = threading.Thread(target=self.tray_icon.run, daemon=True)
-                    self.tray_thread.start()
-                    debug_print("✅ Tray icon started (thread)")
-            except Exception as e:
-                print(f"⚠️  Tray icon run failed: {e}")
         except Exception as e:
             print(f"⚠️  Tray icon setup failed: {e}")
 def main():
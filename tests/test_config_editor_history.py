@@ -0,0 +1,43 @@
+"""
+Folder history eviction in the config editor: a full history keeps its old entries
+"""
+
+from types import SimpleNamespace
+
+from tools import config_editor
+from tools.config_editor import HISTORY_LIMIT, ConfigEditor, FolderSlot, save_history
+
+
+def make_slot(tmp_path, count):
+    folders = [str(tmp_path / f"photos{i}") for i in range(count)]
+    for folder in folders:
+        (tmp_path / folder).mkdir()
+    history_path = tmp_path / "portrait_history.txt"
+    save_history(history_path, folders)
+    return FolderSlot('portrait', history_path), folders
+
+
+def test_selecting_into_a_full_history_drops_the_new_folder_when_written(tmp_path):
+    slot, folders = make_slot(tmp_path, HISTORY_LIMIT)
+    new_folder = tmp_path / "new"
+    new_folder.mkdir()
+    slot.var = SimpleNamespace(set=lambda value: None)
+    editor = SimpleNamespace(_sync_dropdown=lambda slot: None)
+
+    ConfigEditor.select(editor, slot, str(new_folder))
+
+    # Shown for this session, but the default and the older entries stay on disk
+    assert list(slot.history) == folders + [str(new_folder)]
+    save_history(slot.history_path, slot.history)
+    assert config_editor.load_history(slot.history_path) == folders
+
+
+def test_default_set_on_a_full_history_keeps_the_rest_in_order(tmp_path):
+    slot, folders = make_slot(tmp_path, HISTORY_LIMIT)
+    slot.var = SimpleNamespace(get=lambda: folders[2], set=lambda value: None)
+    editor = SimpleNamespace(_sync_dropdown=lambda slot: None)
+
+    ConfigEditor.set_as_default(editor, slot)
+
+    save_history(slot.history_path, slot.history)
+    assert config_editor.load_history(slot.history_path) == [folders[2]] + folders[:2] + folders[3:]
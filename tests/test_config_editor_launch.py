@@ -0,0 +1,82 @@
+"""
+Config editor launch from the tray: one editor at a time, reaped and unlocked once it closes
+"""
+
+import signal
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import main
+from lib.instance_lock import InstanceLock
+
+
+def wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    editor = tmp_path / 'config_editor.py'
+    editor.write_text("import time; time.sleep(0.3)\n")
+    monkeypatch.setattr(main, '_CONFIG_EDITOR', str(editor))
+    monkeypatch.setattr(main, '_CONFIG_EDITOR_LOCK', str(tmp_path / '.config_editor.lock'))
+    monkeypatch.setattr(main, 'EDITOR_REAP_INTERVAL', 0.02)
+    app = main.PhotoFrameApp()
+    yield app
+    app.shutdown()
+    app._worker.join(timeout=5)
+
+
+def test_closed_editor_is_reaped_without_another_click(app, tmp_path):
+    app._open_config_menu_only(None, None)
+    wait_for(lambda: app._config_process is not None)
+    proc = app._config_process
+    assert not InstanceLock(tmp_path / '.config_editor.lock').acquire()
+
+    # Nobody clicks again: the worker notices the exit on its own
+    wait_for(lambda: app._config_process is None)
+    assert proc.returncode == 0
+    lock = InstanceLock(tmp_path / '.config_editor.lock')
+    assert lock.acquire()
+    lock.release()
+
+
+def test_second_launch_while_open_is_refused(app):
+    app._open_config_menu_only(None, None)
+    wait_for(lambda: app._config_process is not None)
+    first = app._config_process
+
+    app._action_queue.put_nowait(app._open_config_action)
+    time.sleep(0.1)
+    assert app._config_process is first
+
+
+@pytest.mark.skipif(not hasattr(signal, 'SIGUSR1'), reason="editor refresh uses SIGUSR1 (POSIX only)")
+def test_tray_orientation_switch_refreshes_the_open_editor(app, tmp_path):
+    # Stand-in editor: reports when its SIGUSR1 handler is in place and when it fires
+    (tmp_path / 'config_editor.py').write_text(
+        "import os, signal, time\n"
+        "here = os.path.dirname(os.path.abspath(__file__))\n"
+        "def refreshed(signum, frame):\n"
+        "    open(os.path.join(here, 'refreshed'), 'w').close()\n"
+        "signal.signal(signal.SIGUSR1, refreshed)\n"
+        "open(os.path.join(here, 'ready'), 'w').close()\n"
+        "deadline = time.monotonic() + 5\n"
+        "while time.monotonic() < deadline and not os.path.exists(os.path.join(here, 'refreshed')):\n"
+        "    time.sleep(0.01)\n"
+    )
+    switched = []
+    app.photoframe = SimpleNamespace(switch_orientation=lambda: switched.append(True))
+
+    app._open_config_menu_only(None, None)
+    wait_for(lambda: (tmp_path / 'ready').exists())
+    app.switch_orientation(None, None)
+
+    wait_for(lambda: (tmp_path / 'refreshed').exists())
+    assert switched == [True]
+    app.photoframe = None  # Nothing to stop at teardown
@@ -0,0 +1,75 @@
+"""
+Serial write timeouts in LCDDisplay: the frame is dropped and the display reset before the next one
+"""
+
+import serial
+from PIL import Image
+
+from lib.display import LCDDisplay
+
+
+class FakeLcd:
+    """Rev. A LCD whose bitmap writes stall; records the recovery sequence"""
+
+    def __init__(self, reset_fails=False):
+        self.calls = []
+        self.reset_fails = reset_fails
+        self.lcd_serial = self
+
+    def get_width(self):
+        return 320
+
+    def get_height(self):
+        return 480
+
+    def DisplayPILImage(self, image, x, y, image_width, image_height):
+        self.calls.append('DisplayPILImage')
+        raise serial.SerialTimeoutException("Write timeout")
+
+    def DisplayBitmap(self, path, x, y):
+        self.calls.append('DisplayBitmap')
+
+    def reset_output_buffer(self):
+        self.calls.append('reset_output_buffer')
+
+    def Reset(self):
+        self.calls.append('Reset')
+        if self.reset_fails:
+            raise serial.SerialTimeoutException("Write timeout")
+
+    def closeSerial(self):
+        self.calls.append('closeSerial')
+
+    def openSerial(self):
+        self.calls.append('openSerial')
+
+    def InitializeComm(self):
+        self.calls.append('InitializeComm')
+
+    def SetBrightness(self, level):
+        self.calls.append(('SetBrightness', level))
+
+
+def make_display(lcd):
+    display = LCDDisplay(brightness=40)
+    display.lcd = lcd
+    return display
+
+
+def test_timed_out_frame_is_dropped_and_the_display_reset():
+    lcd = FakeLcd()
+    display = make_display(lcd)
+
+    assert display._send_image_to_lcd(Image.new('RGB', (320, 480))) is False
+    # No bitmap fallback on the stalled port; the controller is reset instead
+    assert lcd.calls == ['DisplayPILImage', 'reset_output_buffer', 'Reset',
+                         'InitializeComm', ('SetBrightness', 40)]
+
+
+def test_port_is_reopened_when_the_reset_command_times_out_too():
+    lcd = FakeLcd(reset_fails=True)
+    display = make_display(lcd)
+
+    assert display._send_image_to_lcd(Image.new('RGB', (320, 480))) is False
+    assert lcd.calls == ['DisplayPILImage', 'reset_output_buffer', 'Reset', 'closeSerial',
+                         'openSerial', 'InitializeComm', ('SetBrightness', 40)]
@@ -0,0 +1,86 @@
+"""
+Launch-path selection in lib/fast_popen.py: posix_spawn, else subprocess - never a bare fork
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from lib import fast_popen
+from lib.fast_popen import FastPopen
+
+
+def wait_exit(proc, timeout=10):
+    deadline = time.monotonic() + timeout
+    while proc.poll() is None:
+        assert time.monotonic() < deadline, "child did not exit"
+        time.sleep(0.01)
+    return proc.returncode
+
+
+@pytest.fixture(autouse=True)
+def no_fork(monkeypatch):
+    """The tray process is multi-threaded; forking it directly is never allowed"""
+    if hasattr(os, 'fork'):
+        def fail_fork():
+            raise AssertionError("FastPopen must not call os.fork()")
+        monkeypatch.setattr(fast_popen.os, 'fork', fail_fork)
+
+
+@pytest.mark.skipif(not hasattr(os, 'posix_spawn'), reason="needs os.posix_spawn")
+def test_posix_spawn_without_cwd(monkeypatch):
+    def fail_popen(*args, **kwargs):
+        raise AssertionError("subprocess.Popen used although posix_spawn is available")
+
+    monkeypatch.setattr(subprocess, 'Popen', fail_popen)
+    proc = FastPopen([sys.executable, '-c', 'raise SystemExit(3)'])
+
+    assert proc._proc is None
+    assert wait_exit(proc) == 3
+    assert proc.poll() == 3  # Stays put once reaped
+
+
+def test_cwd_uses_subprocess_in_that_directory(tmp_path):
+    out = tmp_path / 'cwd.txt'
+    script = f"import os; open({str(out)!r}, 'w').write(os.getcwd())"
+    proc = FastPopen([sys.executable, '-c', script], cwd=tmp_path)
+
+    assert proc._proc is not None
+    assert wait_exit(proc) == 0
+    assert os.path.samefile(out.read_text(), tmp_path)
+
+
+def test_current_directory_as_cwd_still_spawns():
+    proc = FastPopen([sys.executable, '-c', ''], cwd=os.getcwd())
+
+    assert (proc._proc is None) == hasattr(os, 'posix_spawn')
+    assert wait_exit(proc) == 0
+
+
+class _OsWithoutSpawn:
+    """os as seen on Windows by fast_popen only - subprocess keeps the real module"""
+
+    def __getattr__(self, name):
+        if name == 'posix_spawn':
+            raise AttributeError(name)
+        return getattr(os, name)
+
+
+def test_without_posix_spawn_falls_back_to_subprocess(monkeypatch):
+    monkeypatch.setattr(fast_popen, 'os', _OsWithoutSpawn())
+    proc = FastPopen([sys.executable, '-c', ''])
+
+    assert proc._proc is not None
+    assert wait_exit(proc) == 0
+
+
+def test_poll_while_running_and_signal_after_exit():
+    proc = FastPopen([sys.executable, '-c', 'import time; time.sleep(0.3)'])
+
+    assert proc.poll() is None
+    wait_exit(proc)
+    # Nothing left to signal - must not raise or hit a recycled pid
+    proc.send_signal(15)
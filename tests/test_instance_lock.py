@@ -0,0 +1,40 @@
+"""
+Single-instance lock used to keep one configuration editor open at a time
+"""
+
+from lib.instance_lock import InstanceLock
+
+
+def test_second_acquire_fails_while_held(tmp_path):
+    path = tmp_path / 'editor.lock'
+    first, second = InstanceLock(path), InstanceLock(path)
+
+    assert first.acquire()
+    try:
+        assert not second.acquire()
+    finally:
+        first.release()
+
+
+def test_release_lets_the_next_owner_in_and_is_idempotent(tmp_path):
+    path = tmp_path / 'editor.lock'
+    first, second = InstanceLock(path), InstanceLock(path)
+
+    assert first.acquire()
+    first.release()
+    first.release()
+
+    assert second.acquire()
+    second.release()
+
+
+def test_write_pid_replaces_previous_contents(tmp_path):
+    path = tmp_path / 'editor.lock'
+    lock = InstanceLock(path)
+    assert lock.acquire()
+    try:
+        lock.write_pid(123456)
+        lock.write_pid(7)
+        assert path.read_text() == "7\n"
+    finally:
+        lock.release()
@@ -0,0 +1,200 @@
+"""
+PhotoFrame state swaps and the watcher -> slideshow hand-off
+The watcher only swaps State and wakes the slideshow; every LCD write happens on the slideshow thread.
+"""
+
+import threading
+import time
+
+import pytest
+import yaml
+
+from lib import photoframe
+from lib.config_manager import config_manager
+from lib.photoframe import PhotoFrame
+
+
+class FakeDisplay:
+    """Records which thread touched the display, and whether two writes overlapped"""
+
+    def __init__(self):
+        self.calls = []
+        self.overlapped = False
+        self._busy = threading.Lock()
+
+    def _record(self, what):
+        if not self._busy.acquire(blocking=False):
+            self.overlapped = True
+            return
+        try:
+            self.calls.append((what, threading.current_thread()))
+            time.sleep(0.01)  # A serial write takes a while
+        finally:
+            self._busy.release()
+
+    def display_image_with_overlay(self, image_path, show_time=True, show_date=True):
+        self._record(image_path)
+
+    def apply_config(self, config):
+        self._record('apply_config')
+
+    def drawn(self):
+        return [what for what, _ in self.calls if what != 'apply_config']
+
+
+def wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        time.sleep(0.01)
+
+
+@pytest.fixture(autouse=True)
+def restore_config_manager():
+    # PhotoFrame points the shared config_manager at its own file
+    saved = config_manager.config_path, config_manager._config
+    yield
+    config_manager.config_path, config_manager._config = saved
+
+
+@pytest.fixture
+def frame_files(tmp_path):
+    for orientation, name in (('portrait', 'p.jpg'), ('landscape', 'l.jpg')):
+        (tmp_path / orientation).mkdir()
+        (tmp_path / orientation / name).write_bytes(b'')
+    config = {
+        'photos': {
+            'orientation': 'portrait',
+            'portrait_folder': str(tmp_path / 'portrait'),
+            'landscape_folder': str(tmp_path / 'landscape'),
+        },
+        'slideshow': {'interval': 30, 'show_time': True},
+    }
+    path = tmp_path / 'config.yaml'
+    path.write_text(yaml.safe_dump(config))
+    return path, config
+
+
+def test_concurrent_swaps_keep_state_consistent(frame_files):
+    path, config = frame_files
+    frame = PhotoFrame(str(path), config=config)
+    rounds = 2000
+
+    def swap_config():
+        for i in range(rounds):
+            frame.config = {'slideshow': {'interval': i + 1}}
+
+    def swap_images():
+        for i in range(rounds):
+            frame.current_images = [(f'/img/{i}.jpg', f'{i}.jpg')]
+
+    threads = [threading.Thread(target=swap_config), threading.Thread(target=swap_images)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # Neither writer clobbered the other's last swap, and view still matches config
+    assert frame.config == {'slideshow': {'interval': rounds}}
+    assert frame.current_images == [(f'/img/{rounds - 1}.jpg', f'{rounds - 1}.jpg')]
+    assert frame.view.interval == rounds
+
+
+def test_watcher_hands_changes_to_the_slideshow_thread(frame_files, monkeypatch):
+    monkeypatch.setattr(photoframe, 'CONFIG_WATCH_INTERVAL', 0.02)
+    path, config = frame_files
+    frame = PhotoFrame(str(path))
+    display = FakeDisplay()
+    frame.set_display(display)
+    assert frame.start_slideshow()
+    try:
+        wait_for(lambda: display.drawn())
+        assert display.drawn()[-1].endswith('p.jpg')
+
+        # Display-only edit: applied without cutting the 30 s image short
+        config['slideshow']['show_time'] = False
+        path.write_text(yaml.safe_dump(config))
+        wait_for(lambda: frame._applied_config_gen == 1)
+        assert frame.view.show_time is False
+        assert len(display.drawn()) == 1
+
+        # Orientation edit: new image list, drawn at once rather than after the interval
+        config['photos']['orientation'] = 'landscape'
+        path.write_text(yaml.safe_dump(config))
+        wait_for(lambda: len(display.drawn()) == 2)
+        assert display.drawn()[-1].endswith('l.jpg')
+    finally:
+        frame.stop_slideshow()
+
+    assert not display.overlapped
+    assert all(thread is not frame.watcher_thread for _, thread in display.calls)
+    assert all(thread is frame.slideshow_thread for what, thread in display.calls if what != 'apply_config')
+
+
+def test_manual_operation_pauses_the_watcher(frame_files, monkeypatch):
+    monkeypatch.setattr(photoframe, 'CONFIG_WATCH_INTERVAL', 0.02)
+    path, config = frame_files
+    frame = PhotoFrame(str(path))
+    frame.set_display(FakeDisplay())
+    assert frame.start_slideshow()
+    try:
+        assert frame.hold_reload_lock()
+        assert not frame.hold_reload_lock()  # A second operation must wait its turn
+
+        config['slideshow']['show_time'] = False
+        path.write_text(yaml.safe_dump(config))
+        time.sleep(0.2)
+        assert frame._config_gen == 0
+
+        frame.release_reload_lock()
+        wait_for(lambda: frame._config_gen == 1)
+    finally:
+        frame.stop_slideshow()
+
+
+def test_switch_orientation_runs_under_the_reload_lock(frame_files, monkeypatch):
+    monkeypatch.setattr(photoframe, 'CONFIG_WATCH_INTERVAL', 0.02)
+    path, config = frame_files
+    frame = PhotoFrame(str(path))
+    frame.set_display(FakeDisplay())
+    assert frame.start_slideshow()
+    try:
+        assert frame.hold_reload_lock()
+        frame.switch_orientation()  # Another operation holds the lock - ignored
+        assert frame.view.orientation == 'portrait'
+        frame.release_reload_lock()
+
+        frame.switch_orientation()
+        assert frame.view.orientation == 'landscape'
+        assert yaml.safe_load(path.read_text())['photos']['orientation'] == 'landscape'
+        assert frame.current_images[0][1] == 'l.jpg'
+        # Still paused for the grace period, so the watcher can't race the switch
+        assert not frame.hold_reload_lock()
+    finally:
+        frame.stop_slideshow()
+
+
+def test_image_drawn_by_a_folder_switch_is_not_drawn_again(frame_files, monkeypatch):
+    monkeypatch.setattr(photoframe, 'CONFIG_WATCH_INTERVAL', 0.02)
+    path, config = frame_files
+    frame = PhotoFrame(str(path))
+    display = FakeDisplay()
+    frame.set_display(display)
+    assert frame.start_slideshow()
+    try:
+        wait_for(lambda: display.drawn())
+
+        # What the tray's folder switch does on its action worker
+        assert frame.hold_reload_lock()
+        frame.config = {**config, 'photos': {**config['photos'], 'orientation': 'landscape'},
+                        'slideshow': {'interval': 0.4}}
+        assert frame.load_and_show_images() == 1
+        frame.release_reload_lock(0.05)
+        assert [p.rsplit('/', 1)[-1] for p in display.drawn()] == ['p.jpg', 'l.jpg']
+
+        # The lock lapsing doesn't redraw the same frame; the interval still moves on
+        time.sleep(0.25)
+        assert len(display.drawn()) == 2
+        wait_for(lambda: len(display.drawn()) == 3)
+    finally:
+        frame.stop_slideshow()
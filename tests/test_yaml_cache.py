@@ -0,0 +1,190 @@
+"""
+Cache invalidation and atomic saving in lib/yaml_cache.py
+The config watcher relies on these: a stale parse would hide an edit from the slideshow.
+"""
+
+import json
+import os
+import threading
+
+import pytest
+import yaml
+
+from lib import yaml_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    yaml_cache._CACHE.clear()
+    yield
+    yaml_cache._CACHE.clear()
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Count real YAML parses (cache and sidecar hits don't parse)"""
+    calls = []
+    real_load = yaml.load
+
+    def counting_load(stream, Loader):
+        calls.append(stream)
+        return real_load(stream, Loader=Loader)
+
+    monkeypatch.setattr(yaml_cache.yaml, 'load', counting_load)
+    return calls
+
+
+def write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def leftover_temp_files(folder):
+    return sorted(p.name for p in folder.iterdir() if p.name.endswith('.tmp'))
+
+
+def test_unchanged_file_is_parsed_once(tmp_path, parses):
+    path = tmp_path / 'config.yaml'
+    write(path, 'photos:\n  slideshow_interval: 12\n')
+
+    assert yaml_cache.load_yaml_cached(path) == {'photos': {'slideshow_interval': 12}}
+    assert yaml_cache.load_yaml_cached(path) == {'photos': {'slideshow_interval': 12}}
+    assert len(parses) == 1
+
+
+def test_same_size_edit_within_one_mtime_step_is_seen(tmp_path):
+    # FAT/exFAT keep mtime in 2 s steps: same size + same mtime must not mean "unchanged"
+    path = tmp_path / 'config.yaml'
+    write(path, 'photos:\n  slideshow_interval: 12\n')
+    st = os.stat(path)
+    assert yaml_cache.load_yaml_cached(path)['photos']['slideshow_interval'] == 12
+
+    write(path, 'photos:\n  slideshow_interval: 16\n')
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert os.stat(path).st_size == st.st_size
+
+    assert yaml_cache.load_yaml_cached(path)['photos']['slideshow_interval'] == 16
+    # The sidecar must not resurrect the old parse either
+    yaml_cache._CACHE.clear()
+    assert yaml_cache.load_yaml_cached(path)['photos']['slideshow_interval'] == 16
+
+
+def test_callers_get_independent_copies(tmp_path):
+    path = tmp_path / 'config.yaml'
+    write(path, 'photos:\n  orientation: portrait\n')
+
+    first = yaml_cache.load_yaml_cached(path)
+    first['photos']['orientation'] = 'landscape'
+
+    assert yaml_cache.load_yaml_cached(path)['photos']['orientation'] == 'portrait'
+
+
+def test_sidecar_is_reused_after_restart(tmp_path, parses):
+    path = tmp_path / 'config.yaml'
+    write(path, 'a: 1\n')
+    yaml_cache.load_yaml_cached(path)
+    assert os.path.exists(f"{path}.cache.json")
+
+    yaml_cache._CACHE.clear()  # A new process starts with an empty in-memory cache
+    assert yaml_cache.load_yaml_cached(path) == {'a': 1}
+    assert len(parses) == 1
+
+
+def test_stale_or_corrupt_sidecar_is_ignored(tmp_path):
+    path = tmp_path / 'config.yaml'
+    write(path, 'a: 1\n')
+    write(f"{path}.cache.json", json.dumps({'source': 'not-this-file', 'config': {'a': 'stale'}}))
+    assert yaml_cache.load_yaml_cached(path) == {'a': 1}
+
+    yaml_cache._CACHE.clear()
+    write(f"{path}.cache.json", '{not json')
+    assert yaml_cache.load_yaml_cached(path) == {'a': 1}
+
+
+def test_config_that_does_not_survive_json_gets_no_sidecar(tmp_path):
+    path = tmp_path / 'config.yaml'
+    write(path, 'when: 2024-01-01\n')  # YAML date, no JSON equivalent
+
+    assert str(yaml_cache.load_yaml_cached(path)['when']) == '2024-01-01'
+    assert not os.path.exists(f"{path}.cache.json")
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path, monkeypatch):
+    monkeypatch.setattr(yaml_cache, 'YAML_CACHE_MAX_ENTRIES', 2)
+    paths = []
+    for name in ('a', 'b', 'c'):
+        path = tmp_path / f'{name}.yaml'
+        write(path, f'{name}: 1\n')
+        paths.append(path)
+
+    yaml_cache.load_yaml_cached(paths[0])
+    yaml_cache.load_yaml_cached(paths[1])
+    yaml_cache.load_yaml_cached(paths[0])  # a is now the most recently used
+    yaml_cache.load_yaml_cached(paths[2])
+
+    assert set(yaml_cache._CACHE) == {os.path.abspath(paths[0]), os.path.abspath(paths[2])}
+
+
+def test_save_yaml_writes_and_primes_the_cache(tmp_path, parses):
+    path = tmp_path / 'config.yaml'
+    yaml_cache.save_yaml(path, {'photos': {'orientation': 'landscape'}}, sort_keys=False)
+
+    assert yaml_cache.load_yaml_cached(path) == {'photos': {'orientation': 'landscape'}}
+    assert parses == []
+    with open(path, 'r', encoding='utf-8') as f:
+        assert yaml.safe_load(f) == {'photos': {'orientation': 'landscape'}}
+    assert leftover_temp_files(tmp_path) == []
+
+
+def test_failed_save_leaves_the_old_file_intact(tmp_path, monkeypatch):
+    path = tmp_path / 'config.yaml'
+    write(path, 'a: 1\n')
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(yaml_cache.os, 'replace', failing_replace)
+    with pytest.raises(OSError):
+        yaml_cache.save_yaml(path, {'a': 2})
+
+    with open(path, 'r', encoding='utf-8') as f:
+        assert f.read() == 'a: 1\n'
+    assert leftover_temp_files(tmp_path) == []
+    monkeypatch.undo()
+    assert yaml_cache.load_yaml_cached(path) == {'a': 1}
+
+
+def test_unserializable_config_never_touches_the_file(tmp_path):
+    path = tmp_path / 'config.yaml'
+    write(path, 'a: 1\n')
+
+    with pytest.raises(yaml.YAMLError):
+        yaml_cache.save_yaml(path, {'a': object()})
+
+    with open(path, 'r', encoding='utf-8') as f:
+        assert f.read() == 'a: 1\n'
+
+
+def test_overlapping_saves_never_mix_their_files(tmp_path):
+    # The tray (orientation/folder switch) and the editor (Save) may write at the same time
+    path = tmp_path / 'config.yaml'
+    configs = [{'writer': n, 'folders': [f'/photos/{n}/{i}' for i in range(200)]} for n in range(2)]
+    errors = []
+
+    def save_repeatedly(config):
+        try:
+            for _ in range(50):
+                yaml_cache.save_yaml(path, config)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=save_repeatedly, args=(c,)) for c in configs]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    with open(path, 'r', encoding='utf-8') as f:
+        assert yaml.safe_load(f) in configs
+    assert leftover_temp_files(tmp_path) == []
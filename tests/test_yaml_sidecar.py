@@ -0,0 +1,47 @@
+"""
+The <config>.cache.json contract shared by the photo frame and the config editor
+"""
+
+import os
+import subprocess
+import sys
+
+from lib import yaml_cache
+from lib.yaml_sidecar import content_digest, load_via_sidecar, read_sidecar, record_written
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_importing_the_helpers_does_not_import_yaml():
+    # The editor imports this module at startup and only loads PyYAML for a real parse
+    code = "import sys, lib.yaml_sidecar; sys.exit('yaml' in sys.modules)"
+    assert subprocess.run([sys.executable, '-c', code], cwd=ROOT).returncode == 0
+
+
+def test_parse_is_recorded_for_the_next_reader(tmp_path):
+    path = tmp_path / 'config.yaml'
+    raw = b'a: 1\n'
+    path.write_bytes(raw)
+    digest = content_digest(raw)
+
+    assert load_via_sidecar(path, raw, digest, lambda raw: {'a': 1}) == {'a': 1}
+    assert read_sidecar(path, digest) == {'a': 1}
+    assert read_sidecar(path, content_digest(b'a: 2\n')) is None
+
+
+def test_a_save_from_either_side_is_read_back_without_parsing(tmp_path):
+    path = tmp_path / 'config.yaml'
+    yaml_cache.save_yaml(path, {'photos': {'orientation': 'landscape'}})
+
+    def no_parse(raw):
+        raise AssertionError("sidecar should have been used")
+
+    raw = path.read_bytes()
+    assert load_via_sidecar(path, raw, content_digest(raw), no_parse) == {'photos': {'orientation': 'landscape'}}
+
+    # The editor writes the file itself, then records it
+    path.write_text('photos:\n  orientation: portrait\n')
+    assert record_written(path, {'photos': {'orientation': 'portrait'}}) == content_digest(path.read_bytes())
+    yaml_cache._CACHE.clear()
+    raw = path.read_bytes()
+    assert load_via_sidecar(path, raw, content_digest(raw), no_parse) == {'photos': {'orientation': 'portrait'}}
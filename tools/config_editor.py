@@ -14,29 +14,98 @@ Uses tkinter and PyYAML (already in requirements.txt).
 """
 from __future__ import annotations
 import os
+import copy
+import functools
+import signal
 import sys
-import glob
-import subprocess
+from contextlib import suppress
+from collections import deque
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-import yaml
+from tkinter import ttk
 from pathlib import Path
 
+# Resolve this file once (resolve() walks the filesystem) and derive every path from it
+_HERE = Path(__file__).resolve()
+MAIN_DIR = _HERE.parents[1]
+TOOLS_DIR = _HERE.parent
+CONFIG_PATH = TOOLS_DIR / "config.yaml"
+PORTRAIT_HISTORY = TOOLS_DIR / "portrait_folders_history.txt"
+LANDSCAPE_HISTORY = TOOLS_DIR / "landscape_folders_history.txt"
+HISTORY_LIMIT = 5
+
+# The digest, sidecar and atomic-write helpers are shared with the photo frame, which
+# reads the same <config>.cache.json; lib.yaml_sidecar imports no PyYAML
+if os.fspath(MAIN_DIR) not in sys.path:
+    sys.path.insert(0, os.fspath(MAIN_DIR))
+from lib.yaml_sidecar import content_digest, load_via_sidecar, record_written, write_atomic
+
 # Debug configuration
 DEBUG_ENABLED = True
 
+@functools.cache
+def _yaml():
+    """PyYAML and its fastest safe (loader, dumper), imported on first use
+
+    A fresh JSON sidecar means startup never needs YAML, so the import waits for
+    a real parse or a save.
+    """
+    import yaml
+    # libyaml C implementations when PyYAML was built with them (several times faster)
+    try:
+        from yaml import CSafeLoader as loader, CSafeDumper as dumper
+    except ImportError:
+        from yaml import SafeLoader as loader, SafeDumper as dumper
+    return yaml, loader, dumper
+
+# Parsed YAML per absolute path: (digest, data), shared by the debug flag and the form
+_PARSED = {}
+
+def _yaml_cached_load(path: Path) -> dict:
+    """Parse a YAML file once per change; returns a copy the caller may modify
+
+    The startup debug check and load_config share one parse. Keyed on content, not
+    mtime + size: FAT/exFAT store mtime in 2 s steps, so a same-size edit within one
+    step would look unchanged.
+    """
+    raw = path.read_bytes()
+    digest = content_digest(raw)
+    key = os.fspath(path)  # Paths here all derive from _HERE, so they are already absolute
+    cached = _PARSED.get(key)
+    if cached is None or cached[0] != digest:
+        cached = (digest, load_via_sidecar(path, raw, digest, _parse_yaml))
+        _PARSED[key] = cached
+    return copy.deepcopy(cached[1])
+
+def _parse_yaml(raw: bytes) -> dict:
+    """Parse YAML bytes; raises ValueError so callers don't need yaml imported to handle it"""
+    yaml, loader, _ = _yaml()
+    # The loader detects the encoding (UTF-8 by default) itself
+    try:
+        return yaml.load(raw, Loader=loader) or {}
+    except yaml.YAMLError as e:
+        raise ValueError(str(e)) from e
+
+def _remember_yaml(path: Path, data: dict):
+    """Record a config we just wrote so neither this editor nor the frame re-parses it"""
+    digest = record_written(path, data)
+    if digest is None:
+        _PARSED.pop(os.fspath(path), None)
+        return
+    _PARSED[os.fspath(path)] = (digest, copy.deepcopy(data))
+
+@functools.cache
+def _read_debug_cfg(path_str):
+    """Parse the debug section of a config file (cached per path)"""
+    config = _yaml_cached_load(Path(path_str))
+    return config.get('debug', {})
+
 def load_debug_config():
     """Load debug settings from config file"""
     global DEBUG_ENABLED
-    try:
-        config_path = Path(__file__).parent / "config.yaml"
-        if config_path.exists():
-            with config_path.open("r", encoding="utf-8") as f:
-                config = yaml.safe_load(f) or {}
-                debug_config = config.get('debug', {})
-                DEBUG_ENABLED = debug_config.get('enabled', True)
-    except Exception:
-        pass
+    # Missing, unreadable or malformed config: keep the default
+    with suppress(OSError, ValueError, AttributeError):
+        debug_config = _read_debug_cfg(os.fspath(CONFIG_PATH))
+        DEBUG_ENABLED = debug_config.get('enabled', True)
 
 def debug_print(message, level='info'):
     """Print debug message if debug is enabled"""
@@ -45,96 +114,77 @@ def debug_print(message, level='info'):
 
 load_debug_config()
 
-MAIN_DIR = Path(__file__).resolve().parents[1]
-TOOLS_DIR = Path(__file__).resolve().parent
-CONFIG_PATH = TOOLS_DIR / "config.yaml"
-PORTRAIT_HISTORY = TOOLS_DIR / "portrait_folders_history.txt"
-LANDSCAPE_HISTORY = TOOLS_DIR / "landscape_folders_history.txt"
-HISTORY_LIMIT = 5
-
 
 def load_history(path: Path) -> list[str]:
-    try:
-        if path.exists():
-            with path.open("r", encoding="utf-8") as f:
-                return [line.strip() for line in f.readlines() if line.strip()]
-    except Exception:
-        pass
+    # Missing, unreadable or undecodable history counts as empty
+    with suppress(OSError, ValueError):
+        # One whole-file read; splitlines drops the newlines
+        lines = (line.strip() for line in path.read_text(encoding="utf-8").splitlines())
+        return [line for line in lines if line]
     return []
 
 
+def history_deque(path: Path) -> deque[str]:
+    """History as a deque (first = default); unbounded, save_history caps what is written"""
+    return deque(load_history(path)[:HISTORY_LIMIT])
+
+
 def save_history(path: Path, entries: list[str]):
-    try:
-        # Keep unique, last-most-recent at end
-        unique = []
-        for e in reversed(entries):
-            if e not in unique:
-                unique.append(e)
-        unique = list(reversed(unique))[:HISTORY_LIMIT]
-        with path.open("w", encoding="utf-8") as f:
-            for e in unique:
-                f.write(e + "\n")
-    except Exception:
-        pass
+    # Keep unique, last-most-recent at end (one pass; dicts keep insertion order)
+    unique = list(dict.fromkeys(reversed(entries)))
+    unique.reverse()
+    unique = unique[:HISTORY_LIMIT]
+    # One write to a temp file, then rename: a crash never leaves a half-written history
+    with suppress(OSError):
+        write_atomic(path, "\n".join(unique) + ("\n" if unique else ""))
+
+
+class FolderSlot:
+    """One photos folder row (portrait or landscape): its history file, history and widgets"""
+
+    def __init__(self, name: str, history_path: Path):
+        self.name = name
+        self.history_path = history_path
+        self.folder_key = f"PHOTO_FRAME_FOLDER_{name.upper()}"
+        self.line_key = f"{name.upper()}_HISTORY_LINE"
+        self.history = history_deque(history_path)
+        self.dirty = False  # History changed since the last flush
+        self.values = None  # Tuple last handed to the dropdown
+        self.menu_labels = []  # (folder, label) for the history menu, newest first
+        # Created with the window
+        self.var = None
+        self.dropdown = None
+        self.browse_btn = None
 
 
 class ConfigEditor:
     def __init__(self):
         self.window = tk.Tk()
+        # Stay hidden while widgets are built so the window maps once, fully laid out
+        self.window.withdraw()
         self.window.title("Photo Frame Configuration")
-        
-        # Set window size
-        window_width = 700
-        window_height = 300
-        
-        # Get screen dimensions
-        screen_width = self.window.winfo_screenwidth()
-        screen_height = self.window.winfo_screenheight()
-        
-        # Calculate position for bottom-right corner (above taskbar)
-        # Taskbar is typically 40-50 pixels, so we add some margin
-        taskbar_height = 50
-        margin = 10
-        
-        x_position = screen_width - window_width - margin
-        y_position = screen_height - window_height - taskbar_height - margin -50
-        
-        # Set geometry with position
-        self.window.geometry(f"{window_width}x{window_height}+{x_position}+{y_position}")
-        self.window.resizable(False, False)
+        self._install_refresh_signal()
+
+        # Load history first (edits stay in memory until save/close, see _flush_histories)
+        self.portrait = FolderSlot('portrait', PORTRAIT_HISTORY)
+        self.landscape = FolderSlot('landscape', LANDSCAPE_HISTORY)
+        self._slots = (self.portrait, self.landscape)
+
+        # Widgets: one grid inside a padded frame, laid out by Tk in a single pass
+        self.form = ttk.Frame(self.window, padding=10)
+        self.form.pack(fill='both', expand=True)
+        self.form.columnconfigure(0, minsize=130)  # Row labels
+        self.form.columnconfigure(1, minsize=420)  # Dropdowns / slider
 
-        # Load history first
-        self.portrait_history = load_history(PORTRAIT_HISTORY)
-        self.landscape_history = load_history(LANDSCAPE_HISTORY)
-
-        # Widgets
-        y = 10
-        ttk.Label(self.window, text="Photo Frame Configuration", font=("Arial", 12, "bold")).place(x=10, y=y)
-
-        y += 30
-        ttk.Label(self.window, text="Portrait photos").place(x=10, y=y)
-        self.portrait_dropdown_var = tk.StringVar()
-        self.portrait_dropdown = ttk.Combobox(self.window, textvariable=self.portrait_dropdown_var, values=self.portrait_history, state="readonly")
-        self.portrait_dropdown.place(x=140, y=y, width=420)
-        self.portrait_btn = ttk.Button(self.window, text="...", width=3, command=self.browse_portrait)
-        self.portrait_btn.place(x=570, y=y)
-        # Button to set portrait as default
-        self.portrait_set_btn = ttk.Button(self.window, text="SET", width=5, command=self.set_portrait_as_default)
-        self.portrait_set_btn.place(x=610, y=y)
-
-        y += 36
-        ttk.Label(self.window, text="Landscape photos").place(x=10, y=y)
-        self.landscape_dropdown_var = tk.StringVar()
-        self.landscape_dropdown = ttk.Combobox(self.window, textvariable=self.landscape_dropdown_var, values=self.landscape_history, state="readonly")
-        self.landscape_dropdown.place(x=140, y=y, width=420)
-        self.landscape_btn = ttk.Button(self.window, text="...", width=3, command=self.browse_landscape)
-        self.landscape_btn.place(x=570, y=y)
-        # Button to set landscape as default
-        self.landscape_set_btn = ttk.Button(self.window, text="SET", width=5, command=self.set_landscape_as_default)
-        self.landscape_set_btn.place(x=610, y=y)
-
-        y += 36
-        ttk.Label(self.window, text="Frame orientation").place(x=10, y=y)
+        ttk.Label(self.form, text="Photo Frame Configuration", font=("Arial", 12, "bold")).grid(
+            row=0, column=0, columnspan=5, sticky='w', pady=(0, 6))
+
+        self._build_folder_row(self.portrait, "Portrait photos", 1)
+        self._build_folder_row(self.landscape, "Landscape photos", 2)
+
+        ttk.Label(self.form, text="Frame orientation").grid(row=3, column=0, sticky='w', pady=4)
+        orientation_row = ttk.Frame(self.form)
+        orientation_row.grid(row=3, column=1, columnspan=4, sticky='w', pady=4)
         # Replace combobox with a toggle button that switches between Portrait and Landscape
         self.orientation_var = tk.StringVar(value="Portrait")
         def _toggle_orientation():
@@ -142,135 +192,202 @@ class ConfigEditor:
             nxt = "Landscape" if cur == "Portrait" else "Portrait"
             self.orientation_var.set(nxt)
             self.orientation_toggle.config(text=nxt)
-        self.orientation_toggle = ttk.Button(self.window, text=self.orientation_var.get(), command=_toggle_orientation)
-        self.orientation_toggle.place(x=140, y=y, width=160)
+        self.orientation_toggle = ttk.Button(orientation_row, text=self.orientation_var.get(), width=20, command=_toggle_orientation)
+        self.orientation_toggle.pack(side='left')
         self.rotate_var = tk.BooleanVar()
-        self.rotate_check = ttk.Checkbutton(self.window, text="Rotate 180°", variable=self.rotate_var)
-        self.rotate_check.place(x=320, y=y)
+        self.rotate_check = ttk.Checkbutton(orientation_row, text="Rotate 180°", variable=self.rotate_var)
+        self.rotate_check.pack(side='left', padx=(20, 0))
 
         # (no extra rotate angle configuration)
 
-        y += 36
-        ttk.Label(self.window, text="Change interval (sec)").place(x=10, y=y)
+        ttk.Label(self.form, text="Change interval (sec)").grid(row=4, column=0, sticky='w', pady=4)
         # Replace spinbox with a slider from 4 to 300 seconds with 4-second steps
         self.interval_var = tk.IntVar(value=12)
-        self.interval_scale = ttk.Scale(self.window, from_=4, to=300, orient='horizontal', 
-                                       command=lambda v: self.interval_var.set(int(float(v)) // 4 * 4))
-        self.interval_scale.place(x=140, y=y, width=520)
+        self._interval_after_id = None  # Pending coalesced interval_var update
+        self._pending_interval = None  # Latest slider position not yet applied
+        self._last_snapped = None  # Last slider value written to interval_var
+        self.interval_scale = ttk.Scale(self.form, from_=4, to=300, orient='horizontal', 
+                                       command=self._schedule_interval_update)
+        self.interval_scale.grid(row=4, column=1, columnspan=3, sticky='ew', pady=4)
         # Show current value label
-        self.interval_value_label = ttk.Label(self.window, textvariable=self.interval_var)
-        self.interval_value_label.place(x=670, y=y)
+        self.interval_value_label = ttk.Label(self.form, textvariable=self.interval_var)
+        self.interval_value_label.grid(row=4, column=4, sticky='w', padx=(10, 0))
 
-        y += 36
+        options_row = ttk.Frame(self.form)
+        options_row.grid(row=5, column=0, columnspan=5, sticky='w', pady=4)
         self.random_var = tk.BooleanVar()
-        self.random_check = ttk.Checkbutton(self.window, text="Random order", variable=self.random_var)
-        self.random_check.place(x=10, y=y)
+        self.random_check = ttk.Checkbutton(options_row, text="Random order", variable=self.random_var)
+        self.random_check.pack(side='left', padx=(0, 40))
         self.aspect_var = tk.BooleanVar(value=True)
-        self.aspect_check = ttk.Checkbutton(self.window, text="Maintain aspect ratio", variable=self.aspect_var)
-        self.aspect_check.place(x=180, y=y)
+        self.aspect_check = ttk.Checkbutton(options_row, text="Maintain aspect ratio", variable=self.aspect_var)
+        self.aspect_check.pack(side='left', padx=(0, 40))
         # Add show_time checkbox
         self.show_time_var = tk.BooleanVar(value=True)
-        self.show_time_check = ttk.Checkbutton(self.window, text="Show clock", variable=self.show_time_var)
-        self.show_time_check.place(x=410, y=y)
+        self.show_time_check = ttk.Checkbutton(options_row, text="Show clock", variable=self.show_time_var)
+        self.show_time_check.pack(side='left')
 
         # Buttons
-        y += 40
-        self.save_btn = ttk.Button(self.window, text="Save", command=self.on_save_run)
-        self.save_btn.place(x=540, y=y, width=140, height=60)
+        self.save_btn = ttk.Button(self.form, text="Save", command=self.on_save_run)
+        self.save_btn.grid(row=6, column=1, columnspan=4, sticky='e', pady=(10, 0), ipadx=40, ipady=18)
 
         self.load_config()
         # Removed default folders loading
 
-        # Bind right-click on browse buttons to show history
-        self.portrait_btn.bind("<Button-3>", lambda e: self.show_portrait_history_menu(e))
-        self.landscape_btn.bind("<Button-3>", lambda e: self.show_landscape_history_menu(e))
+        # Size the window to what the grid asks for (fonts/DPI/theme vary, a fixed size clips)
+        self.window.update_idletasks()
+        window_width = self.window.winfo_reqwidth()
+        window_height = self.window.winfo_reqheight()
+        
+        # Get screen dimensions
+        screen_width = self.window.winfo_screenwidth()
+        screen_height = self.window.winfo_screenheight()
+        
+        # Calculate position for bottom-right corner (above taskbar)
+        # Taskbar is typically 40-50 pixels, so we add some margin
+        taskbar_height = 50
+        margin = 10
+        
+        x_position = max(0, screen_width - window_width - margin)
+        y_position = max(0, screen_height - window_height - taskbar_height - margin -50)
+        
+        # Set geometry with position
+        self.window.geometry(f"{window_width}x{window_height}+{x_position}+{y_position}")
+        self.window.minsize(window_width, window_height)
+        self.window.resizable(False, False)
+
+        # Closing the window keeps history changes made in this session
+        self.window.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.window.deiconify()
         
 
 
-    def set_portrait_as_default(self):
-        """Set current portrait folder as default (move to first position in history)"""
-        folder = self.portrait_dropdown_var.get()
-        if folder:
-            # Remove from current position if exists
-            if folder in self.portrait_history:
-                self.portrait_history.remove(folder)
-            # Insert at beginning
-            self.portrait_history.insert(0, folder)
-            # Update dropdown values
-            self.portrait_dropdown.configure(values=self.portrait_history)
-            save_history(PORTRAIT_HISTORY, self.portrait_history)
-            # Update dropdown to show first item (default)
-            self.portrait_dropdown_var.set(self.portrait_history[0])
-            print(f"Set as default portrait: {folder}")
-    
-    def set_landscape_as_default(self):
-        """Set current landscape folder as default (move to first position in history)"""
-        folder = self.landscape_dropdown_var.get()
+    def _build_folder_row(self, slot, label, row):
+        """Label, history dropdown, browse (right-click: history) and SET buttons for one slot"""
+        ttk.Label(self.form, text=label).grid(row=row, column=0, sticky='w', pady=4)
+        slot.var = tk.StringVar()
+        slot.dropdown = ttk.Combobox(self.form, textvariable=slot.var, state="readonly")
+        self._sync_dropdown(slot)
+        slot.dropdown.grid(row=row, column=1, sticky='ew', pady=4)
+        slot.browse_btn = ttk.Button(self.form, text="...", width=3, command=lambda: self.browse(slot))
+        slot.browse_btn.grid(row=row, column=2, padx=(10, 0), pady=4)
+        slot.browse_btn.bind("<Button-3>", lambda e: self.show_history_menu(slot, e))
+        # Button to set the folder as default
+        ttk.Button(self.form, text="SET", width=5, command=lambda: self.set_as_default(slot)).grid(
+            row=row, column=3, padx=(6, 0), pady=4)
+
+    def _install_refresh_signal(self):
+        """Refresh the form when the tray app sends SIGUSR1 (POSIX only)"""
+        if not hasattr(signal, 'SIGUSR1'):
+            return
+        # Tk's mainloop may not return to Python for a pending signal, so route it
+        # through a wakeup fd that Tk itself watches
+        rfd, wfd = os.pipe()
+        os.set_blocking(rfd, False)
+        os.set_blocking(wfd, False)
+        signal.set_wakeup_fd(wfd)
+        signal.signal(signal.SIGUSR1, lambda signum, frame: None)
+
+        def _on_wakeup(fd, mask):
+            try:
+                data = os.read(fd, 512)
+            except BlockingIOError:
+                return
+            if signal.SIGUSR1 in data:
+                self.refresh()
+
+        self.window.tk.createfilehandler(rfd, tk.READABLE, _on_wakeup)
+
+    def _schedule_interval_update(self, value):
+        """Slider callback: remember the position, apply only the latest one when Tk goes idle"""
+        self._pending_interval = value
+        if self._interval_after_id is None:
+            self._interval_after_id = self.window.after_idle(self._apply_interval)
+
+    def _apply_interval(self):
+        self._interval_after_id = None
+        snapped = int(float(self._pending_interval)) // 4 * 4
+        # Moves within the same 4-second step don't need an IntVar write (and label redraw)
+        if snapped != self._last_snapped:
+            self._last_snapped = snapped
+            self.interval_var.set(snapped)
+
+    def _sync_dropdown(self, slot):
+        """Show the slot's history in its dropdown (and menu), touching Tk only if the list changed"""
+        values = tuple(slot.history)
+        if slot.values != values:
+            slot.dropdown.configure(values=values)
+            slot.values = values
+            # History menu labels change with the same list, so build them here once
+            slot.menu_labels = [(folder, os.path.basename(folder) or folder)
+                                for folder in reversed(values[-HISTORY_LIMIT:])]
+
+    def _flush_histories(self):
+        """Write the history files changed since the last flush"""
+        for slot in self._slots:
+            if slot.dirty:
+                save_history(slot.history_path, slot.history)
+                slot.dirty = False
+
+    def refresh(self):
+        """Re-read history files and config.yaml into the form"""
+        self._flush_histories()
+        for slot in self._slots:
+            slot.history = history_deque(slot.history_path)
+            self._sync_dropdown(slot)
+        self.load_config()
+        debug_print("⚙️ Configuration reloaded (refresh requested)")
+
+    def set_as_default(self, slot):
+        """Set the slot's current folder as default (move to first position in history)"""
+        folder = slot.var.get()
         if folder:
             # Remove from current position if exists
-            if folder in self.landscape_history:
-                self.landscape_history.remove(folder)
-            # Insert at beginning
-            self.landscape_history.insert(0, folder)
+            if folder in slot.history:
+                slot.history.remove(folder)
+            # Insert at beginning (past HISTORY_LIMIT, save_history drops the newest entries)
+            slot.history.appendleft(folder)
             # Update dropdown values
-            self.landscape_dropdown.configure(values=self.landscape_history)
-            save_history(LANDSCAPE_HISTORY, self.landscape_history)
+            self._sync_dropdown(slot)
+            slot.dirty = True
             # Update dropdown to show first item (default)
-            self.landscape_dropdown_var.set(self.landscape_history[0])
-            print(f"Set as default landscape: {folder}")
+            slot.var.set(slot.history[0])
+            print(f"Set as default {slot.name}: {folder}")
 
-    
     def load_config(self):
         if CONFIG_PATH.exists():
             try:
-                with CONFIG_PATH.open("r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f) or {}
+                data = _yaml_cached_load(CONFIG_PATH)
                 cfg = data.get('config', {})
-                # Use line numbers from config to get correct folders from history
-                portrait_line = cfg.get('PORTRAIT_HISTORY_LINE', 0)
-                landscape_line = cfg.get('LANDSCAPE_HISTORY_LINE', 0)
-                
-                # Get folder based on line number, fallback to first or config value
-                if self.portrait_history and portrait_line < len(self.portrait_history):
-                    portrait_folder = self.portrait_history[portrait_line]
-                else:
-                    portrait_folder = self.portrait_history[0] if self.portrait_history else cfg.get('PHOTO_FRAME_FOLDER_PORTRAIT', cfg.get('PHOTO_FRAME_FOLDER', ''))
-                    
-                if self.landscape_history and landscape_line < len(self.landscape_history):
-                    landscape_folder = self.landscape_history[landscape_line]
-                else:
-                    landscape_folder = self.landscape_history[0] if self.landscape_history else cfg.get('PHOTO_FRAME_FOLDER_LANDSCAPE', cfg.get('PHOTO_FRAME_FOLDER', ''))
-                    
-                self.portrait_dropdown_var.set(portrait_folder)
-                self.landscape_dropdown_var.set(landscape_folder)
+                photos = data.get('photos', {})
+                for slot in self._slots:
+                    # Use line numbers from config to get correct folders from history
+                    line = cfg.get(slot.line_key, 0)
+                    # Get folder based on line number, fallback to first or config value
+                    if slot.history and line < len(slot.history):
+                        folder = slot.history[line]
+                    else:
+                        folder = slot.history[0] if slot.history else cfg.get(slot.folder_key, cfg.get('PHOTO_FRAME_FOLDER', ''))
+                    slot.var.set(folder)
                 
 
                 # Orientation: set toggle text accordingly
-                photos = data.get('photos', {})
                 orientation_val = photos.get('orientation', 'Portrait')
                 orientation_val = str(orientation_val).capitalize()
                 self.orientation_var.set(orientation_val)
-                try:
+                with suppress(tk.TclError):
                     self.orientation_toggle.config(text=orientation_val)
-                except Exception:
-                    pass
                 self.rotate_var.set(cfg.get('PHOTO_FRAME_INVERSE', False))
                 # no per-angle setting to load
                 # interval: if photos.slideshow_interval exists prefer that
-                interval_val = cfg.get('PHOTO_FRAME_INTERVAL', cfg.get('PHOTO_FRAME_INTERVAL', 10))
-                # Also check photos section
-                photos = data.get('photos', {})
-                if 'slideshow_interval' in photos:
-                    interval_val = photos.get('slideshow_interval')
+                interval_val = photos.get('slideshow_interval', cfg.get('PHOTO_FRAME_INTERVAL', 10))
                 try:
                     interval_val = int(interval_val)
-                except Exception:
+                except (TypeError, ValueError):
                     interval_val = 10
                 self.interval_var.set(interval_val)
-                try:
+                self._last_snapped = None  # Let the next slider move write interval_var again
+                with suppress(tk.TclError):
                     self.interval_scale.set(interval_val)
-                except Exception:
-                    pass
                 self.random_var.set(cfg.get('PHOTO_FRAME_RANDOM', False))
                 self.aspect_var.set(cfg.get('PHOTO_FRAME_MAINTAIN_ASPECT_RATIO', True))
                 
@@ -280,146 +397,133 @@ class ConfigEditor:
             except Exception as e:
                 print(f"Error loading config: {e}")
 
-    def show_portrait_history_menu(self, event):
+    def show_history_menu(self, slot, event):
         menu = tk.Menu(self.window, tearoff=0)
-        menu.add_command(label="Browse for new folder...", command=self.browse_portrait)
-        if self.portrait_history:
+        menu.add_command(label="Browse for new folder...", command=functools.partial(self.browse, slot))
+        if slot.menu_labels:
             menu.add_separator()
-            for folder in reversed(self.portrait_history[-HISTORY_LIMIT:]):
-                name = os.path.basename(folder) or folder
-                menu.add_command(label=name, command=lambda f=folder: self.select_portrait(f))
+            # Labels are rebuilt only when the history changes (_sync_dropdown)
+            select = functools.partial(self.select, slot)
+            for folder, name in slot.menu_labels:
+                menu.add_command(label=name, command=functools.partial(select, folder))
         try:
             menu.tk_popup(event.x_root, event.y_root)
         finally:
             menu.grab_release()
 
-    def show_landscape_history_menu(self, event):
-        menu = tk.Menu(self.window, tearoff=0)
-        menu.add_command(label="Browse for new folder...", command=self.browse_landscape)
-        if self.landscape_history:
-            menu.add_separator()
-            for folder in reversed(self.landscape_history[-HISTORY_LIMIT:]):
-                name = os.path.basename(folder) or folder
-                menu.add_command(label=name, command=lambda f=folder: self.select_landscape(f))
-        try:
-            menu.tk_popup(event.x_root, event.y_root)
-        finally:
-            menu.grab_release()
-
-    def browse_portrait(self):
-        current = self.portrait_dropdown_var.get()
+    def browse(self, slot):
+        current = slot.var.get()
+        from tkinter import filedialog  # Only loaded when the user actually browses
         folder = filedialog.askdirectory(initialdir=current or os.path.expanduser("~"))
         if folder:
-            self.select_portrait(folder)
+            # The dialog only returns existing directories, no need to stat again
+            self.select(slot, folder, checked=True)
 
-    def browse_landscape(self):
-        current = self.landscape_dropdown_var.get()
-        folder = filedialog.askdirectory(initialdir=current or os.path.expanduser("~"))
-        if folder:
-            self.select_landscape(folder)
-
-    def select_portrait(self, folder):
-        if folder and os.path.exists(folder):
-            self.portrait_dropdown_var.set(folder)
+    def select(self, slot, folder, checked=False):
+        """Make folder the slot's current one; history entries may have gone stale, so check those"""
+        if folder and (checked or os.path.isdir(folder)):
+            slot.var.set(folder)
             # update history
-            if folder in self.portrait_history:
-                self.portrait_history.remove(folder)
-            self.portrait_history.append(folder)
-            self.portrait_dropdown.configure(values=self.portrait_history)
-            save_history(PORTRAIT_HISTORY, self.portrait_history)
-
-    def select_landscape(self, folder):
-        if folder and os.path.exists(folder):
-            self.landscape_dropdown_var.set(folder)
-            if folder in self.landscape_history:
-                self.landscape_history.remove(folder)
-            self.landscape_history.append(folder)
-            self.landscape_dropdown.configure(values=self.landscape_history)
-            save_history(LANDSCAPE_HISTORY, self.landscape_history)
-
-    def on_save_run(self):
-        # Build config structure
-        cfg = {}
-        if CONFIG_PATH.exists():
-            try:
-                with CONFIG_PATH.open("r", encoding="utf-8") as f:
-                    cfg = yaml.safe_load(f) or {}
-            except Exception:
-                cfg = {}
-        # Ensure both 'config' and 'photos' sections are present
-        if 'config' not in cfg:
-            cfg['config'] = {}
-        if 'photos' not in cfg:
-            cfg['photos'] = {}
-
-        # Save config-level flags
-        cfg['config']['MODE'] = 'PICTURE_FRAME'
-        cfg['config']['PHOTO_FRAME_INVERSE'] = bool(self.rotate_var.get())
-
-        # Save photos section used by PhotoFrame
-        portrait_folder = self.portrait_dropdown_var.get()
-        landscape_folder = self.landscape_dropdown_var.get()
-        cfg['photos']['portrait_folder'] = portrait_folder
-        cfg['photos']['landscape_folder'] = landscape_folder
+            if folder in slot.history:
+                slot.history.remove(folder)
+            slot.history.append(folder)
+            self._sync_dropdown(slot)
+            slot.dirty = True
+
+    def _config_for_save(self):
+        """config.yaml as it is now, to merge the form into
         
-        # Save line numbers of selected folders in history
+        Re-read rather than reused from load_config, so edits made meanwhile (e.g. a tray
+        folder switch) are kept; unchanged content is served from the parse cache.
+        """
         try:
-            portrait_line = self.portrait_history.index(portrait_folder) if portrait_folder in self.portrait_history else 0
-        except (ValueError, AttributeError):
-            portrait_line = 0
-            
-        try:
-            landscape_line = self.landscape_history.index(landscape_folder) if landscape_folder in self.landscape_history else 0
-        except (ValueError, AttributeError):
-            landscape_line = 0
-            
-        cfg['config']['PORTRAIT_HISTORY_LINE'] = portrait_line
-        cfg['config']['LANDSCAPE_HISTORY_LINE'] = landscape_line
-        
+            return _yaml_cached_load(CONFIG_PATH)
+        except (OSError, ValueError):
+            return {}
 
-        cfg['photos']['orientation'] = self.orientation_var.get().lower()
-        # no per-angle setting saved
+    def on_save_run(self):
+        # Apply a slider move still waiting for an idle moment
+        if self._interval_after_id is not None:
+            self.window.after_cancel(self._interval_after_id)
+            self._apply_interval()
+
+        # Read every widget once (each get() is a round trip into Tcl)
+        folders = {slot: slot.var.get() for slot in self._slots}
+        orientation = self.orientation_var.get()
         try:
-            cfg['photos']['slideshow_interval'] = int(self.interval_var.get())
-        except Exception:
-            cfg['photos']['slideshow_interval'] = 10
-
-        # Keep backwards-compatible config keys too
-        cfg['config']['PHOTO_FRAME_FOLDER_PORTRAIT'] = portrait_folder
-        cfg['config']['PHOTO_FRAME_FOLDER_LANDSCAPE'] = landscape_folder
-        cfg['config']['PHOTO_FRAME_ORIENTATION'] = self.orientation_var.get()
-        cfg['config']['PHOTO_FRAME_INTERVAL'] = cfg['photos']['slideshow_interval']
-        cfg['config']['PHOTO_FRAME_RANDOM'] = bool(self.random_var.get())
-        cfg['config']['PHOTO_FRAME_MAINTAIN_ASPECT_RATIO'] = bool(self.aspect_var.get())
-
-        # Save slideshow section with show_time
-        if 'slideshow' not in cfg:
-            cfg['slideshow'] = {}
-        cfg['slideshow']['interval'] = cfg['photos']['slideshow_interval']
-        cfg['slideshow']['show_time'] = bool(self.show_time_var.get())
-        cfg['slideshow']['show_date'] = False  # Keep date disabled
-        cfg['slideshow']['shuffle'] = bool(self.random_var.get())
-
+            interval = int(self.interval_var.get())
+        except (tk.TclError, ValueError):
+            interval = 10
+        rotate = bool(self.rotate_var.get())
+        shuffle = bool(self.random_var.get())
+        aspect = bool(self.aspect_var.get())
+        show_time = bool(self.show_time_var.get())
+
+        # Merge the form into copies of the sections it owns (created if missing);
+        # everything else is shared with the current config untouched
+        current = self._config_for_save()
+        cfg = dict(current)
+        for section in ('config', 'photos', 'slideshow'):
+            cfg[section] = dict(cfg.get(section) or {})
+        cfg['config'].update({
+            'MODE': 'PICTURE_FRAME',
+            'PHOTO_FRAME_INVERSE': rotate,
+            # Line numbers of the selected folders in their histories
+            **{slot.line_key: slot.history.index(folder) if folder in slot.history else 0
+               for slot, folder in folders.items()},
+            # Backwards-compatible keys
+            **{slot.folder_key: folder for slot, folder in folders.items()},
+            'PHOTO_FRAME_ORIENTATION': orientation,
+            'PHOTO_FRAME_INTERVAL': interval,
+            'PHOTO_FRAME_RANDOM': shuffle,
+            'PHOTO_FRAME_MAINTAIN_ASPECT_RATIO': aspect,
+        })
+        # Photos section used by PhotoFrame (no per-angle setting saved)
+        cfg['photos'].update({
+            **{f'{slot.name}_folder': folder for slot, folder in folders.items()},
+            'orientation': orientation.lower(),
+            'slideshow_interval': interval,
+        })
+        cfg['slideshow'].update({
+            'interval': interval,
+            'show_time': show_time,
+            'show_date': False,  # Keep date disabled
+            'shuffle': shuffle,
+        })
+
+        self._flush_histories()
+        if cfg == current:
+            # Nothing changed: skip the rewrite (and fsync), and the frame's reload
+            debug_print("⚙️ Configuration unchanged, nothing to save")
+            self.window.destroy()
+            return
         try:
-            with CONFIG_PATH.open("w", encoding="utf-8") as f:
-                yaml.safe_dump(cfg, f, sort_keys=False)
+            # Temp file + rename: a power cut mid-save can't truncate config.yaml
+            yaml, _, dumper = _yaml()
+            write_atomic(CONFIG_PATH, yaml.dump(cfg, Dumper=dumper, sort_keys=False))
+            # Fresh sidecar: the frame's reload after this save reads JSON, not YAML
+            _remember_yaml(CONFIG_PATH, cfg)
             debug_print("⚙️ Configuration saved successfully")
         except Exception as e:
+            from tkinter import messagebox
             messagebox.showerror("Error", f"Could not save config.yaml: {e}")
             return
 
         # Close the editor after saving
         self.window.destroy()
 
+    def on_close(self):
+        """Window closed without saving: keep history changes, leave config.yaml alone"""
+        self._flush_histories()
+        self.window.destroy()
+
     def on_exit(self):
+        self._flush_histories()
         # Try to terminate parent process if possible (same behavior as 3.5inch's configure)
-        try:
-            import os as _os, signal as _signal
-            if hasattr(_os, 'getppid'):
-                parent_pid = _os.getppid()
-                _os.kill(parent_pid, _signal.SIGTERM)
-        except Exception:
-            pass
+        with suppress(OSError):
+            if hasattr(os, 'getppid'):
+                parent_pid = os.getppid()
+                os.kill(parent_pid, signal.SIGTERM)
         self.window.destroy()
 
     def run(self):
@@ -427,5 +531,9 @@ class ConfigEditor:
 
 
 if __name__ == '__main__':
+    # The tray may send a refresh while the window is still being built; its default
+    # action would kill the editor, and the form reads config.yaml when built anyway
+    if hasattr(signal, 'SIGUSR1'):
+        signal.signal(signal.SIGUSR1, signal.SIG_IGN)
     editor = ConfigEditor()
     editor.run()